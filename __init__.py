@@ -1,7 +1,6 @@
 """The Synology DSM component."""
 from __future__ import annotations
 
-from itertools import chain
 from typing import Any
 
 from homeassistant.helpers.device_registry import DeviceEntry
@@ -30,7 +29,7 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .api.SynoApi import SynoApi
+from .api.SynoApi import SynoApi, session_store, snapshot_store
 from .const import (
     DEFAULT_VERIFY_SSL,
     DOMAIN,
@@ -44,7 +43,7 @@ CONFIG_SCHEMA = cv.removed(DOMAIN, raise_if_present=False)
 
 ATTRIBUTION = "Data provided by Synology"
 
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER]
+PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER, Platform.SENSOR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -58,33 +57,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Continue setup
     api = SynoApi(hass, entry)
-    try:
-        await api.async_setup()
-    except (
-            SynologyDSMLogin2SARequiredException,
-            SynologyDSMLoginDisabledAccountException,
-            SynologyDSMLoginInvalidException,
-            SynologyDSMLoginPermissionDeniedException,
-    ) as err:
-        if err.args[0] and isinstance(err.args[0], dict):
-            # pylint: disable=no-member
-            details = err.args[0].get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
-        else:
-            details = EXCEPTION_UNKNOWN
-        raise ConfigEntryAuthFailed(f"reason: {details}") from err
-    except (SynologyDSMLoginFailedException, SynologyDSMRequestException) as err:
-        if err.args[0] and isinstance(err.args[0], dict):
-            # pylint: disable=no-member
-            details = err.args[0].get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
-        else:
-            details = EXCEPTION_UNKNOWN
-        raise ConfigEntryNotReady(details) from err
+    if await api.async_restore_snapshot():
+        # Entities start from the last known players, the NAS is reached in the background
+        api.async_connect()
+    else:
+        try:
+            await api.async_setup()
+        except (
+                SynologyDSMLogin2SARequiredException,
+                SynologyDSMLoginDisabledAccountException,
+                SynologyDSMLoginInvalidException,
+                SynologyDSMLoginPermissionDeniedException,
+        ) as err:
+            if err.args[0] and isinstance(err.args[0], dict):
+                # pylint: disable=no-member
+                details = err.args[0].get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
+            else:
+                details = EXCEPTION_UNKNOWN
+            raise ConfigEntryAuthFailed(f"reason: {details}") from err
+        except (SynologyDSMLoginFailedException, SynologyDSMRequestException) as err:
+            if err.args[0] and isinstance(err.args[0], dict):
+                # pylint: disable=no-member
+                details = err.args[0].get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
+            else:
+                details = EXCEPTION_UNKNOWN
+            raise ConfigEntryNotReady(details) from err
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         SYNO_API: api,
     }
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    entry.async_on_unload(api.library.async_stop)
+
     # hass.config_entries.async_setup_platforms(entry, PLATFORMS)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -107,6 +114,12 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored session and players of a removed entry."""
+    await session_store(hass, entry).async_remove()
+    await snapshot_store(hass, entry).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -116,19 +129,15 @@ async def async_remove_config_entry_device(
         hass: HomeAssistant, entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
     """Remove synology_dsm config entry from a device."""
-    api: SynoApi = hass.data[DOMAIN][entry.entry_id].SYNO_API
+    api: SynoApi = hass.data[DOMAIN][entry.entry_id][SYNO_API]
     serial = api.information.serial
 
-    current = await hass.async_add_executor_job(api.dsm.audio_station.remote_player_get_players)
-
-    device_ids = chain(
-        (player.id for player in current),
-    )
+    # Known players, refreshed by the periodic discovery
+    device_ids = (player.id for player in api.players)
 
     return not device_entry.identifiers.intersection(
         (
             (DOMAIN, serial),  # Base device
-            *((DOMAIN, f"{serial}_{id}") for id in device_ids),  # Storage and cameras
+            *((DOMAIN, device_id) for device_id in device_ids),  # Remote players
         )
     )
-
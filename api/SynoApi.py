@@ -1,4 +1,8 @@
-from typing import Callable
+import asyncio
+from collections.abc import Awaitable, Iterable
+from datetime import timedelta
+from functools import partial
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -11,18 +15,75 @@ from homeassistant.const import (
     CONF_VERIFY_SSL,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 
-from ..synology_dsm.api.audio_station import SynoAudioStation
-from ..synology_dsm import SynologyDSM
-from ..synology_dsm.api.dsm.information import SynoDSMInformation
+from ..synology_dsm.api.audio_station import Player, RemotePlayerStatus
+from ..synology_dsm.api.audio_station.models.queue_mode import QueueMode
 from ..synology_dsm.exceptions import (
     SynologyDSMAPIErrorException,
+    SynologyDSMException,
     SynologyDSMLoginFailedException,
     SynologyDSMRequestException
 )
 
+from .SynoAudioStationClient import DSMInformation, SynoAudioStationClient
+from ..browse_media import SynologyDSMMediaBrowser
+from ..cover_art import SynologyDSMCoverArtCache
+from ..coordinator import SynologyDSMMetricsUpdateCoordinator, SynologyDSMRemotePlayerUpdateCoordinator
+from ..executor import BlockingExecutor
+from ..lanes import COMMAND_VOLUME, CommandLane, LatestValueLane
+from ..library import SynologyDSMLibraryIndex
+from ..queue_cache import SynologyDSMQueueCache
+from ..metrics import RequestMetrics
+from ..scheduler import RequestPriority, RequestScheduler, request_priority
 from ..shared import LOGGER
-from ..const import CONF_DEVICE_TOKEN
+from ..supervisor import ConnectionSupervisor
+from ..const import (
+    API_KEY_REMOTE_PLAYER,
+    CONF_DEVICE_TOKEN,
+    CONF_EXECUTOR_QUEUE,
+    CONF_EXECUTOR_THREADS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_EXECUTOR_QUEUE,
+    DEFAULT_EXECUTOR_THREADS,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
+
+SESSION_STORAGE_VERSION = 1
+# Logins are rare, a short delay still merges the writes of concurrent ones
+SESSION_SAVE_DELAY = 1  # sec
+SNAPSHOT_STORAGE_VERSION = 1
+# Statuses change every poll, the store also writes them when hass stops
+SNAPSHOT_SAVE_DELAY = 300  # sec
+# Renderers come and go rarely, look for them at a low pace
+PLAYER_DISCOVERY_INTERVAL = timedelta(minutes=5)
+# Songs per updateplaylist request, long queues are sent in several
+QUEUE_CHUNK_SIZE = 200
+# Dragging the volume slider sends many values, send at most one per interval
+VOLUME_MIN_INTERVAL = 0.3  # sec
+
+
+def session_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store keeping the DSM session of an entry across restarts."""
+    return Store(
+        hass, SESSION_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.session", private=True, atomic_writes=True
+    )
+
+
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store keeping the players of an entry and their last status across restarts."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot", atomic_writes=True)
+
+
+def signal_new_players(entry: ConfigEntry) -> str:
+    """Return the dispatcher signal announcing the players that joined an entry."""
+    return f"{DOMAIN}_{entry.entry_id}_new_players"
 
 
 class SynoApi:
@@ -40,8 +101,40 @@ class SynoApi:
 
         self.initialized = False
         # DSM APIs
-        self.dsm: SynologyDSM | None = None
-        self.information: SynoDSMInformation | None = None
+        self.audio_station: SynoAudioStationClient | None = None
+        self.information: DSMInformation | None = None
+        self.remote_player_coordinator: SynologyDSMRemotePlayerUpdateCoordinator | None = None
+        self.metrics_coordinator: SynologyDSMMetricsUpdateCoordinator | None = None
+        self.library: SynologyDSMLibraryIndex | None = None
+        self.media_browser: SynologyDSMMediaBrowser | None = None
+        self.cover_art: SynologyDSMCoverArtCache | None = None
+        self.queue_cache: SynologyDSMQueueCache | None = None
+        self.players: list[Player] = []
+        self.metrics = RequestMetrics()
+        # Commands go first, polls and the library sync use what is left
+        self.scheduler = RequestScheduler(
+            entry.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
+        # Blocking work stays off the executor shared by all of Home Assistant
+        self.executor = BlockingExecutor(
+            f"{DOMAIN}_{entry.entry_id}",
+            entry.options.get(CONF_EXECUTOR_THREADS, DEFAULT_EXECUTOR_THREADS),
+            entry.options.get(CONF_EXECUTOR_QUEUE, DEFAULT_EXECUTOR_QUEUE),
+        )
+        entry.async_on_unload(self.executor.async_shutdown)
+
+        self.supervisor = ConnectionSupervisor(hass, entry, self._async_availability_changed)
+        self._session_store = session_store(hass, entry)
+        self._snapshot_store = snapshot_store(hass, entry)
+
+        # Songs still being appended to the queue of each player
+        self._queue_loads: dict[str, asyncio.Task[None]] = {}
+        entry.async_on_unload(self._async_cancel_queue_loads)
+
+        # Commands of each player, shared by its entity and the services
+        self._command_lanes: dict[str, CommandLane] = {}
+        self._volume_lanes: dict[str, LatestValueLane[int]] = {}
+        entry.async_on_unload(self._async_cancel_lanes)
 
         # Should we fetch them
         self._fetching_entities: dict[str, set[str]] = {}
@@ -49,26 +142,316 @@ class SynoApi:
 
         LOGGER.debug("__name__ = " + __name__)
 
-    async def async_setup(self) -> None:
-        """Start interacting with the NAS."""
-        self.dsm = SynologyDSM(
-            self._entry.data[CONF_HOST],
-            self._entry.data[CONF_PORT],
+    @property
+    def name(self) -> str:
+        """Return the name of the NAS."""
+        return self._entry.title
+
+    @callback
+    def _async_create_client(self) -> None:
+        """Create the Audio Station client, without talking to the NAS yet."""
+        if self.audio_station is not None:
+            return
+        self.audio_station = SynoAudioStationClient(
+            async_get_clientsession(self._hass, self._entry.data[CONF_VERIFY_SSL]),
+            self.config_url,
             self._entry.data[CONF_USERNAME],
             self._entry.data[CONF_PASSWORD],
-            self._entry.data[CONF_SSL],
-            self._entry.data[CONF_VERIFY_SSL],
-            timeout=self._entry.options.get(CONF_TIMEOUT),
+            timeout=self._entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
             device_token=self._entry.data.get(CONF_DEVICE_TOKEN),
+            metrics=self.metrics,
+            scheduler=self.scheduler,
         )
-        await self._hass.async_add_executor_job(self.dsm.login)
+        self.audio_station.on_session_changed = self._async_save_session
 
-        self._async_setup_api_requests()
+    @callback
+    def _async_create_components(self) -> None:
+        """Create the parts working on top of the client, once the serial is known."""
+        if self.remote_player_coordinator is not None:
+            return
+        self.remote_player_coordinator = SynologyDSMRemotePlayerUpdateCoordinator(
+            self._hass, self._entry, self
+        )
+        self._entry.async_on_unload(
+            self.remote_player_coordinator.async_add_listener(self._async_save_snapshot)
+        )
+        self.metrics_coordinator = SynologyDSMMetricsUpdateCoordinator(self._hass, self._entry, self)
+        self.library = SynologyDSMLibraryIndex(
+            self._hass, self.audio_station, self.executor, self.information.serial
+        )
+        self.media_browser = SynologyDSMMediaBrowser(self.audio_station, self.library)
+        self.cover_art = SynologyDSMCoverArtCache(
+            self._hass, self.audio_station, self.executor, self.information.serial
+        )
+        self.queue_cache = SynologyDSMQueueCache(self._hass, self.audio_station)
 
-        await self._hass.async_add_executor_job(self._fetch_device_configuration)
-        await self.async_update()
+    async def async_restore_snapshot(self) -> bool:
+        """Restore the players and statuses known when hass stopped.
+
+        Entities can be created from them right away, before the NAS is reached.
+        """
+        if not (data := await self._snapshot_store.async_load()):
+            return False
+
+        self._async_create_client()
+        self.information = DSMInformation(data["information"])
+        self.players = [Player.from_dict(player) for player in data["players"]]
+        self._async_create_components()
+        self.remote_player_coordinator.async_restore(
+            {player_id: RemotePlayerStatus.from_dict(status) for player_id, status in data["statuses"].items()}
+        )
+        return True
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Persist the known players and their last status."""
+        if not self.initialized:
+            return
+        self._snapshot_store.async_delay_save(
+            lambda: {
+                "information": self.information.to_dict(),
+                "players": [player.to_dict() for player in self.players],
+                "statuses": {
+                    player_id: status.to_dict()
+                    for player_id, status in self.remote_player_coordinator.data.items()
+                },
+            },
+            SNAPSHOT_SAVE_DELAY,
+        )
+
+    async def async_setup(self) -> None:
+        """Start interacting with the NAS."""
+        self._async_create_client()
+        if await self._async_resume_session():
+            # The probe of the session already fetched the information
+            self._async_setup_api_requests()
+        else:
+            await self.audio_station.async_login()
+            await self.async_update()
+        self._async_create_components()
+        self._async_update_players(await self.audio_station.remote_player_get_players())
         self.initialized = True
 
+        # Fetch all statuses in one cycle instead of one update per entity
+        await self.remote_player_coordinator.async_refresh_players(player.id for player in self.players)
+        self.library.async_start()
+        self._entry.async_on_unload(
+            async_track_time_interval(self._hass, self._async_discover_players, PLAYER_DISCOVERY_INTERVAL)
+        )
+
+    @callback
+    def async_connect(self) -> None:
+        """Set up in the background, while the entities show the restored snapshot."""
+        self.supervisor.async_connect(self.async_setup)
+
+    @callback
+    def async_report_failure(self, err: Exception) -> None:
+        """Record a failed request, reconnecting in place when the NAS looks down."""
+        self.supervisor.async_report_failure(err, self._async_reconnect, self._async_on_reconnected)
+
+    async def _async_reconnect(self) -> None:
+        """Log in again and check the NAS answers."""
+        await self.audio_station.async_login()
+        await self.async_update()
+
+    async def _async_on_reconnected(self) -> None:
+        """Catch up with what changed while the NAS was unreachable."""
+        await self._async_discover_players()
+        await self.remote_player_coordinator.async_refresh_players(player.id for player in self.players)
+
+    @callback
+    def _async_availability_changed(self) -> None:
+        """Let the entities know the NAS went down or came back."""
+        if self.remote_player_coordinator is not None:
+            self.remote_player_coordinator.async_update_listeners()
+
+    async def _async_resume_session(self) -> bool:
+        """Reuse the session of the previous run if the NAS still accepts it, fetching the information."""
+        data = await self._session_store.async_load()
+        if (
+                not data
+                or data.get("url") != self.config_url
+                or data.get("username") != self._entry.data[CONF_USERNAME]
+        ):
+            return False
+
+        self.audio_station.restore_session(data)
+        if (information := await self.audio_station.async_probe_session()) is None:
+            LOGGER.debug("Stored session of '%s' expired, logging in", self._entry.unique_id)
+            return False
+
+        self.information = information
+        LOGGER.debug("Resumed the stored session of '%s'", self._entry.unique_id)
+        return True
+
+    @callback
+    def _async_save_session(self) -> None:
+        """Persist the current session, so the next start can skip the login."""
+        self._session_store.async_delay_save(
+            lambda: {
+                "url": self.config_url,
+                "username": self._entry.data[CONF_USERNAME],
+                **self.audio_station.session_data,
+            },
+            SESSION_SAVE_DELAY,
+        )
+
+    @callback
+    def _async_update_players(self, players: list[Player]) -> list[str]:
+        """Replace the known players, announce new ones and drop vanished ones.
+
+        Returns the ids of the new players.
+        """
+        known = {player.id for player in self.players}
+        current = {player.id for player in players}
+        self.players = players
+
+        if vanished := known - current:
+            LOGGER.debug("Players %s left '%s'", vanished, self._entry.unique_id)
+            self.remote_player_coordinator.async_remove_players(vanished)
+            self.queue_cache.async_forget(vanished)
+
+        new = [player for player in players if player.id not in known]
+        if new:
+            LOGGER.debug("Players %s joined '%s'", [player.id for player in new], self._entry.unique_id)
+            async_dispatcher_send(self._hass, signal_new_players(self._entry), new)
+        return [player.id for player in new]
+
+    async def _async_discover_players(self, _now: Any = None) -> None:
+        """Look for players that appeared or vanished since the last look."""
+        try:
+            with request_priority(RequestPriority.POLL):
+                players = await self.audio_station.remote_player_get_players()
+        except (SynologyDSMAPIErrorException, SynologyDSMLoginFailedException, SynologyDSMRequestException) as err:
+            LOGGER.debug("Unable to discover players of '%s': %s", self._entry.unique_id, err)
+            return
+        if new := self._async_update_players(players):
+            await self.remote_player_coordinator.async_refresh_players(new)
+
+    @property
+    def remote_player_ids(self) -> set[str]:
+        """Return the ids of the remote players entities are subscribed to."""
+        return set(self._fetching_entities.get(API_KEY_REMOTE_PLAYER, set()))
+
+    async def async_get_remote_player_statuses(
+            self, player_ids: Iterable[str]
+    ) -> dict[str, RemotePlayerStatus | Exception]:
+        """Fetch the status of remote players in batches of compound requests.
+
+        Each player maps to its status, or to the error that prevented fetching it.
+        """
+        player_ids = list(player_ids)
+        batches = [
+            player_ids[i:i + DEFAULT_MAX_BATCH_SIZE]
+            for i in range(0, len(player_ids), DEFAULT_MAX_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self.audio_station.remote_player_get_player_statuses(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        statuses: dict[str, RemotePlayerStatus | Exception] = {}
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                statuses.update({player_id: result for player_id in batch})
+            else:
+                statuses.update(result)
+        return statuses
+
+    async def async_queue_songs(
+            self, player_id: str, song_ids: list[str], mode: QueueMode, play_directly: bool
+    ) -> bool:
+        """Queue songs on a player, returning as soon as the first chunk is queued.
+
+        Playback starts after the first chunk, the rest is appended in the
+        background. Replacing the queue stops appending an earlier one, while
+        appending waits for an earlier load so the order is kept.
+        """
+        loading = self._queue_loads.pop(player_id, None)
+        if loading is not None:
+            if mode == QueueMode.replace:
+                loading.cancel()
+            else:
+                await asyncio.wait([loading])
+
+        first, rest = song_ids[:QUEUE_CHUNK_SIZE], song_ids[QUEUE_CHUNK_SIZE:]
+        queue_total = await self.audio_station.remote_player_queue_songs(player_id, first, mode, play_directly)
+        if rest:
+            task = self._hass.async_create_background_task(
+                self._async_append_songs(player_id, rest, queue_total), f"Queue songs on {player_id}"
+            )
+            self._queue_loads[player_id] = task
+            task.add_done_callback(
+                lambda done: self._queue_loads.pop(player_id) if self._queue_loads.get(player_id) is done else None
+            )
+        return True
+
+    async def _async_append_songs(self, player_id: str, song_ids: list[str], queue_total: int) -> None:
+        """Append songs to a queue one chunk at a time."""
+        for start in range(0, len(song_ids), QUEUE_CHUNK_SIZE):
+            try:
+                queue_total = await self.audio_station.remote_player_queue_songs(
+                    player_id, song_ids[start:start + QUEUE_CHUNK_SIZE], QueueMode.append, False, queue_total
+                )
+            except SynologyDSMException as err:
+                LOGGER.warning(
+                    "Unable to queue the last %s songs on player %s: %s", len(song_ids) - start, player_id, err
+                )
+                return
+        LOGGER.debug("Queued %s songs in the background on player %s", len(song_ids), player_id)
+
+    @callback
+    def _async_cancel_queue_loads(self) -> None:
+        """Stop appending songs to queues."""
+        for task in self._queue_loads.values():
+            task.cancel()
+        self._queue_loads.clear()
+
+    @callback
+    def command_lane(self, player_id: str) -> CommandLane:
+        """Return the lane sending the commands of a player in order."""
+        if (lane := self._command_lanes.get(player_id)) is None:
+            lane = self._command_lanes[player_id] = CommandLane(self._hass, player_id)
+        return lane
+
+    @callback
+    def volume_lane(self, player_id: str) -> LatestValueLane[int]:
+        """Return the lane throttling the volume changes of a player, range 0..100."""
+        if (lane := self._volume_lanes.get(player_id)) is None:
+            lane = self._volume_lanes[player_id] = LatestValueLane(
+                self._hass, f"{player_id} volume", partial(self._async_send_volume, player_id), VOLUME_MIN_INTERVAL
+            )
+        return lane
+
+    async def async_player_command(
+            self, player_id: str, kind: str | None, send: Callable[[], Awaitable[Any]]
+    ) -> bool:
+        """Send a command in order with the other commands of a player and read the player back.
+
+        Returns False when a later command of the same kind superseded it.
+        """
+        if not await self.command_lane(player_id).async_run(kind, send):
+            return False
+        self.remote_player_coordinator.async_request_confirmation(player_id)
+        return True
+
+    async def _async_send_volume(self, player_id: str, volume: int) -> None:
+        """Send the volume chosen last through the command lane."""
+        try:
+            await self.command_lane(player_id).async_run(
+                COMMAND_VOLUME, partial(self.audio_station.remote_player_volume, player_id, volume)
+            )
+        finally:
+            self.remote_player_coordinator.async_request_confirmation(player_id)
+
+    @callback
+    def _async_cancel_lanes(self) -> None:
+        """Drop the commands not sent yet."""
+        for lane in (*self._command_lanes.values(), *self._volume_lanes.values()):
+            lane.async_cancel()
+        self._command_lanes.clear()
+        self._volume_lanes.clear()
+
     @callback
     def subscribe(self, api_key: str, unique_id: str) -> Callable[[], None]:
         """Subscribe an entity to API fetches."""
@@ -97,14 +480,10 @@ class SynoApi:
             )
             return
 
-    def _fetch_device_configuration(self) -> None:
-        """Fetch initial device config."""
-        self.information = self.dsm.information
-
     async def async_unload(self) -> None:
         """Stop interacting with the NAS and prepare for removal from hass."""
         try:
-            await self._hass.async_add_executor_job(self.dsm.logout)
+            await self.audio_station.async_logout()
         except (SynologyDSMAPIErrorException, SynologyDSMRequestException) as err:
             LOGGER.debug(
                 "Logout from '%s' not possible:%s", self._entry.unique_id, err
@@ -115,20 +494,14 @@ class SynoApi:
         LOGGER.debug("Start data update for '%s'", self._entry.unique_id)
         self._async_setup_api_requests()
         try:
-            await self._hass.async_add_executor_job(
-                self.dsm.update, self._with_information
-            )
+            if self._with_information:
+                self.information = await self.audio_station.async_get_information()
         except (SynologyDSMLoginFailedException, SynologyDSMRequestException) as err:
-            if not self.initialized:
-                raise err
-
-            LOGGER.warning(
-                "Connection error during update, fallback by reloading the entry"
-            )
-            LOGGER.debug(
-                "Connection error during update of '%s' with exception: %s",
-                self._entry.unique_id,
-                err,
-            )
-            await self._hass.config_entries.async_reload(self._entry.entry_id)
-            return
+            if self.initialized:
+                LOGGER.debug(
+                    "Connection error during update of '%s' with exception: %s",
+                    self._entry.unique_id,
+                    err,
+                )
+                self.async_report_failure(err)
+            raise
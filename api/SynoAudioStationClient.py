@@ -0,0 +1,663 @@
+"""Native asyncio client for the Synology DSM Audio Station API."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import json
+from time import monotonic
+from typing import Any, NamedTuple
+
+import aiohttp
+
+from ..synology_dsm.api.audio_station import (
+    Player,
+    RemotePlayerAction,
+    RemotePlayerStatus,
+    RepeatMode,
+    SongSortMode,
+)
+from ..synology_dsm.api.audio_station.models.queue_mode import QueueMode
+from ..synology_dsm.exceptions import (
+    SynologyDSMAPIErrorException,
+    SynologyDSMLogin2SAFailedException,
+    SynologyDSMLogin2SARequiredException,
+    SynologyDSMLoginDisabledAccountException,
+    SynologyDSMLoginFailedException,
+    SynologyDSMLoginInvalidException,
+    SynologyDSMLoginPermissionDeniedException,
+    SynologyDSMRequestException,
+)
+
+from ..const import DEFAULT_MAX_CONCURRENT_REQUESTS
+from ..metrics import RequestMetrics
+from ..scheduler import RequestPriority, RequestScheduler, request_priority
+from ..shared import LOGGER
+
+API_INFO = "SYNO.API.Info"
+API_AUTH = "SYNO.API.Auth"
+API_DSM_INFO = "SYNO.DSM.Info"
+API_REMOTE_PLAYER = "SYNO.AudioStation.RemotePlayer"
+API_ENTRY_REQUEST = "SYNO.Entry.Request"
+API_SONG = "SYNO.AudioStation.Song"
+API_ALBUM = "SYNO.AudioStation.Album"
+API_ARTIST = "SYNO.AudioStation.Artist"
+API_GENRE = "SYNO.AudioStation.Genre"
+API_FOLDER = "SYNO.AudioStation.Folder"
+API_PLAYLIST = "SYNO.AudioStation.Playlist"
+API_COVER = "SYNO.AudioStation.Cover"
+
+# Versions this client speaks, the NAS may support newer ones
+API_VERSIONS = {
+    API_INFO: 1,
+    API_AUTH: 6,
+    API_DSM_INFO: 2,
+    API_REMOTE_PLAYER: 2,
+    API_ENTRY_REQUEST: 1,
+    API_SONG: 3,
+    API_ALBUM: 3,
+    API_ARTIST: 4,
+    API_GENRE: 3,
+    API_FOLDER: 3,
+    API_PLAYLIST: 3,
+    API_COVER: 3,
+}
+
+AUDIO_STATION_SESSION = "AudioStation"
+STATUS_ADDITIONAL = "song_tag,song_audio,subplayer_volume"
+PLAYLIST_ADDITIONAL = "song_tag,song_audio"
+SONG_ADDITIONAL = "song_tag,song_audio"
+LIBRARY_SHARED = "shared"
+
+# Error codes meaning the SID is no longer valid and a new login is needed
+SESSION_ERROR_CODES = (106, 107, 119)
+
+
+class CompoundCall(NamedTuple):
+    """A single API method call inside a SYNO.Entry.Request compound request."""
+
+    api: str
+    method: str
+    params: dict[str, Any]
+
+
+class DSMInformation:
+    """Information about the NAS returned by SYNO.DSM.Info."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize the information from the raw API data."""
+        self._data = data
+
+    @property
+    def model(self) -> str | None:
+        """Model of the NAS."""
+        return self._data.get("model")
+
+    @property
+    def serial(self) -> str | None:
+        """Serial of the NAS."""
+        return self._data.get("serial")
+
+    @property
+    def version_string(self) -> str | None:
+        """Version of the NAS."""
+        return self._data.get("version_string")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the raw API data."""
+        return self._data
+
+
+class SynoAudioStationClient:
+    """Talk to Audio Station over a pooled keep-alive aiohttp session."""
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession,
+            base_url: str,
+            username: str,
+            password: str,
+            timeout: int,
+            device_token: str | None = None,
+            metrics: RequestMetrics | None = None,
+            scheduler: RequestScheduler | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self.metrics = metrics or RequestMetrics()
+        self.scheduler = scheduler or RequestScheduler(DEFAULT_MAX_CONCURRENT_REQUESTS)
+        self._session = session
+        self._base_url = base_url
+        self._username = username
+        self._password = password
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+
+        self.device_token = device_token
+        self.session_id: str | None = None
+        self.syno_token: str | None = None
+
+        self._apis: dict[str, dict[str, Any]] = {
+            API_INFO: {"path": "query.cgi", "maxVersion": 1},
+        }
+        self._login_lock = asyncio.Lock()
+        # Control calls waiting for the next loop iteration, sent together
+        self._pending_controls: list[tuple[CompoundCall, asyncio.Future[Any]]] = []
+        self._control_flushes: set[asyncio.Task[None]] = set()
+        # Called after every successful login, to persist the new session
+        self.on_session_changed: Callable[[], None] | None = None
+
+    def _build_request(
+            self, api: str, method: str, params: dict[str, Any] | None
+    ) -> tuple[str, dict[str, Any], dict[str, str]]:
+        """Return the url, form data and headers calling an API method."""
+        if api not in self._apis:
+            raise SynologyDSMAPIErrorException(api, 102, f"API {api} not available on this NAS")
+
+        api_info = self._apis[api]
+        query: dict[str, Any] = {
+            "api": api,
+            "version": min(API_VERSIONS.get(api, 1), api_info["maxVersion"]),
+            "method": method,
+            **(params or {}),
+        }
+        headers = {}
+        if self.session_id:
+            query["_sid"] = self.session_id
+        if self.syno_token:
+            headers["X-SYNO-TOKEN"] = self.syno_token
+
+        return f"{self._base_url}/webapi/{api_info['path']}", query, headers
+
+    async def _async_http(
+            self, api: str, method: str, params: dict[str, Any] | None = None, metric: str | None = None
+    ) -> dict[str, Any]:
+        """Do a single HTTP request once the scheduler allows it and return the decoded response."""
+        return await self.scheduler.async_run(lambda: self._async_post_json(api, method, params, metric))
+
+    async def _async_http_binary(
+            self, api: str, method: str, params: dict[str, Any] | None = None
+    ) -> tuple[bytes, str]:
+        """Do a single HTTP request once the scheduler allows it and return the raw body and its content type."""
+        return await self.scheduler.async_run(lambda: self._async_post_binary(api, method, params))
+
+    async def _async_post_json(
+            self, api: str, method: str, params: dict[str, Any] | None, metric: str | None
+    ) -> dict[str, Any]:
+        """Send a request and decode the response."""
+        # Built once a slot is free, so the session is the current one
+        url, query, headers = self._build_request(api, method, params)
+        started = monotonic()
+        result: dict[str, Any] = {}
+        try:
+            async with self._session.post(
+                    url, data=query, headers=headers, timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
+                result = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            self.metrics.record(metric or f"{api}.{method}", monotonic() - started, True)
+            raise SynologyDSMRequestException(err) from err
+        # Requests interrupted by the scheduler are sent again and not recorded
+        self.metrics.record(metric or f"{api}.{method}", monotonic() - started, not result.get("success"))
+        return result
+
+    async def _async_post_binary(
+            self, api: str, method: str, params: dict[str, Any] | None
+    ) -> tuple[bytes, str]:
+        """Send a request and return the raw body and its content type."""
+        url, query, headers = self._build_request(api, method, params)
+        started = monotonic()
+        try:
+            async with self._session.post(
+                    url, data=query, headers=headers, timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self.metrics.record(f"{api}.{method}", monotonic() - started, True)
+            raise SynologyDSMRequestException(err) from err
+        self.metrics.record(f"{api}.{method}", monotonic() - started, False)
+        return body, response.content_type
+
+    async def async_login(self, otp_code: str | None = None) -> None:
+        """Discover the available APIs and open a session."""
+        async with self._login_lock:
+            await self._async_login(otp_code)
+
+    async def _async_relogin(self, stale_session_id: str | None) -> None:
+        """Open a new session, unless a concurrent call already replaced the stale one."""
+        async with self._login_lock:
+            if self.session_id == stale_session_id:
+                await self._async_login()
+
+    async def _async_login(self, otp_code: str | None = None) -> None:
+        """Log in, the login lock must be held."""
+        # Every other request waits for the login, whoever started it
+        with request_priority(RequestPriority.INTERACTIVE):
+            await self._async_login_requests(otp_code)
+
+    async def _async_login_requests(self, otp_code: str | None) -> None:
+        """Discover the APIs and open a session."""
+        result = await self._async_http(API_INFO, "query", {"query": "all"})
+        self._apis.update(result["data"])
+
+        params: dict[str, Any] = {
+            "account": self._username,
+            "passwd": self._password,
+            "session": AUDIO_STATION_SESSION,
+            "format": "sid",
+            "enable_syno_token": "yes",
+        }
+        if otp_code:
+            params["otp_code"] = otp_code
+            params["enable_device_token"] = "yes"
+        if self.device_token:
+            params["device_id"] = self.device_token
+
+        self.session_id = None
+        self.syno_token = None
+        result = await self._async_http(API_AUTH, "login", params)
+
+        if not result.get("success"):
+            code = result.get("error", {}).get("code")
+            if code == 400:
+                raise SynologyDSMLoginInvalidException(self._username)
+            if code == 401:
+                raise SynologyDSMLoginDisabledAccountException(self._username)
+            if code == 402:
+                raise SynologyDSMLoginPermissionDeniedException(self._username)
+            if code == 403:
+                raise SynologyDSMLogin2SARequiredException(self._username)
+            if code == 404:
+                raise SynologyDSMLogin2SAFailedException()
+            raise SynologyDSMLoginFailedException(code)
+
+        self.session_id = result["data"]["sid"]
+        self.syno_token = result["data"].get("synotoken")
+        if result["data"].get("did"):
+            self.device_token = result["data"]["did"]
+        if self.on_session_changed is not None:
+            self.on_session_changed()
+
+    @property
+    def session_data(self) -> dict[str, Any]:
+        """Return what is needed to resume the session later."""
+        return {
+            "sid": self.session_id,
+            "synotoken": self.syno_token,
+            "did": self.device_token,
+            "apis": self._apis,
+        }
+
+    def restore_session(self, data: dict[str, Any]) -> None:
+        """Reuse a session saved earlier, check it with async_probe_session."""
+        self._apis.update(data["apis"])
+        self.session_id = data["sid"]
+        self.syno_token = data.get("synotoken")
+        self.device_token = data.get("did") or self.device_token
+
+    async def async_probe_session(self) -> DSMInformation | None:
+        """Return the information about the NAS if it still accepts the session, None otherwise."""
+        if not self.session_id:
+            return None
+        result = await self._async_http(API_DSM_INFO, "getinfo")
+        if not result.get("success"):
+            return None
+        return DSMInformation(result["data"])
+
+    async def async_logout(self) -> None:
+        """Close the session."""
+        await self.async_request(API_AUTH, "logout", {"session": AUDIO_STATION_SESSION})
+        self.session_id = None
+        self.syno_token = None
+
+    async def async_request(
+            self, api: str, method: str, params: dict[str, Any] | None = None, metric: str | None = None
+    ) -> Any:
+        """Call an API method and return its data, logging in again if the session expired.
+
+        Its latency is recorded under the metric name, by default the API method.
+        """
+        if not self.session_id:
+            await self._async_relogin(None)
+
+        session_id = self.session_id
+        result = await self._async_http(api, method, params, metric)
+        if not result.get("success"):
+            code = result.get("error", {}).get("code")
+            if code not in SESSION_ERROR_CODES:
+                raise SynologyDSMAPIErrorException(api, code, result.get("error"))
+
+            LOGGER.debug("Session expired calling %s.%s, logging in again", api, method)
+            await self._async_relogin(session_id)
+            result = await self._async_http(api, method, params, metric)
+            if not result.get("success"):
+                raise SynologyDSMAPIErrorException(
+                    api, result.get("error", {}).get("code"), result.get("error")
+                )
+
+        return result.get("data")
+
+    async def async_download(
+            self, api: str, method: str, params: dict[str, Any] | None = None
+    ) -> tuple[bytes, str] | None:
+        """Fetch a binary resource, or None when the NAS answers with an error instead."""
+        if not self.session_id:
+            await self._async_relogin(None)
+
+        session_id = self.session_id
+        body, content_type = await self._async_http_binary(api, method, params)
+        if content_type != "application/json":
+            return body, content_type
+
+        try:
+            error = json.loads(body).get("error", {})
+        except ValueError:
+            return None
+        if error.get("code") not in SESSION_ERROR_CODES:
+            return None
+
+        LOGGER.debug("Session expired downloading %s.%s, logging in again", api, method)
+        await self._async_relogin(session_id)
+        body, content_type = await self._async_http_binary(api, method, params)
+        if content_type == "application/json":
+            return None
+        return body, content_type
+
+    @property
+    def supports_compound(self) -> bool:
+        """Return True if the NAS can run several API methods in one request."""
+        return API_ENTRY_REQUEST in self._apis
+
+    async def async_compound(
+            self, calls: list[CompoundCall]
+    ) -> list[Any | SynologyDSMAPIErrorException]:
+        """Run several API methods in one HTTP request.
+
+        Returns the data of every call in order, or the error it raised.
+        """
+        compound = [
+            {
+                "api": call.api,
+                "method": call.method,
+                "version": min(API_VERSIONS.get(call.api, 1), self._apis.get(call.api, {}).get("maxVersion", 1)),
+                **call.params,
+            }
+            for call in calls
+        ]
+        params = {"stop_when_error": "false", "compound": json.dumps(compound)}
+        # Recorded under the methods it runs, a batch of status reads is not a control command
+        metric = "+".join(sorted({f"{call.api}.{call.method}" for call in calls}))
+        session_id = self.session_id
+        data = await self.async_request(API_ENTRY_REQUEST, "request", params, metric)
+        if any(
+                result.get("error", {}).get("code") in SESSION_ERROR_CODES
+                for result in data["result"]
+        ):
+            LOGGER.debug("Session expired inside compound request, logging in again")
+            await self._async_relogin(session_id)
+            data = await self.async_request(API_ENTRY_REQUEST, "request", params, metric)
+
+        results: list[Any | SynologyDSMAPIErrorException] = []
+        for call, result in zip(calls, data["result"]):
+            if result.get("success"):
+                results.append(result.get("data"))
+            else:
+                error = result.get("error", {})
+                results.append(SynologyDSMAPIErrorException(call.api, error.get("code"), error))
+        return results
+
+    async def async_get_information(self) -> DSMInformation:
+        """Fetch information about the NAS."""
+        return DSMInformation(await self.async_request(API_DSM_INFO, "getinfo"))
+
+    async def library_list(
+            self, api: str, offset: int, limit: int, **params: Any
+    ) -> dict[str, Any]:
+        """Fetch one page of a library listing (songs, albums, artists, genres...)."""
+        return await self.async_request(
+            api, "list", {"library": LIBRARY_SHARED, "offset": offset, "limit": limit, **params}
+        )
+
+    async def get_album_cover(self, album: str, album_artist: str) -> tuple[bytes, str] | None:
+        """Fetch the cover of an album, None when it has none."""
+        return await self.async_download(
+            API_COVER,
+            "getcover",
+            {
+                "library": LIBRARY_SHARED,
+                "album_name": album,
+                "album_artist_name": album_artist,
+                # Without this the NAS answers with its placeholder image
+                "output_default": "false",
+            },
+        )
+
+    async def remote_player_get_players(self) -> list[Player]:
+        """Fetch all remote players known to Audio Station."""
+        data = await self.async_request(
+            API_REMOTE_PLAYER, "list", {"type": "all", "additional": "subplayer_list"}
+        )
+        return [Player.from_dict(player) for player in data["players"]]
+
+    async def remote_player_get_player_status(self, player_id: str) -> RemotePlayerStatus:
+        """Fetch the status of a remote player."""
+        data = await self.async_request(
+            API_REMOTE_PLAYER, "getstatus", {"id": player_id, "additional": STATUS_ADDITIONAL}
+        )
+        return RemotePlayerStatus.from_dict(data)
+
+    async def remote_player_get_player_statuses(
+            self, player_ids: list[str], commands: list[CompoundCall] | None = None
+    ) -> dict[str, RemotePlayerStatus | SynologyDSMAPIErrorException]:
+        """Fetch the status of several players in one compound request.
+
+        Queued commands are sent first in the same request, so the returned
+        statuses already reflect them.
+        """
+        commands = commands or []
+        if not self.supports_compound:
+            for command in commands:
+                await self.async_request(command.api, command.method, command.params)
+            statuses: dict[str, RemotePlayerStatus | SynologyDSMAPIErrorException] = {}
+            for player_id in player_ids:
+                try:
+                    statuses[player_id] = await self.remote_player_get_player_status(player_id)
+                except SynologyDSMAPIErrorException as err:
+                    statuses[player_id] = err
+            return statuses
+
+        calls = commands + [
+            CompoundCall(API_REMOTE_PLAYER, "getstatus", {"id": player_id, "additional": STATUS_ADDITIONAL})
+            for player_id in player_ids
+        ]
+        results = await self.async_compound(calls)
+
+        for command, result in zip(commands, results):
+            if isinstance(result, SynologyDSMAPIErrorException):
+                LOGGER.warning("Queued %s.%s failed: %s", command.api, command.method, result)
+
+        return {
+            player_id: result if isinstance(result, SynologyDSMAPIErrorException)
+            else RemotePlayerStatus.from_dict(result)
+            for player_id, result in zip(player_ids, results[len(commands):])
+        }
+
+    @staticmethod
+    def remote_player_control_call(player_id: str, action: str, value: Any = None) -> CompoundCall:
+        """Build a control call, to be sent directly or queued in a compound request."""
+        params = {"id": player_id, "action": action}
+        if value is not None:
+            params["value"] = value
+        return CompoundCall(API_REMOTE_PLAYER, "control", params)
+
+    async def remote_player_control(
+            self, player_id: str, action: RemotePlayerAction, value: Any = None
+    ) -> bool:
+        """Send a control action to a remote player."""
+        return await self._async_control(player_id, action.value, value)
+
+    async def _async_control(self, player_id: str, action: str, value: Any = None) -> bool:
+        """Send a control action, including those that are not part of RemotePlayerAction.
+
+        Actions issued in the same loop iteration, like a group pause or a
+        service call targeting several players, share one compound request.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending_controls.append((self.remote_player_control_call(player_id, action, value), future))
+        if len(self._pending_controls) == 1:
+            loop.call_soon(self._flush_controls)
+        await future
+        return True
+
+    def _flush_controls(self) -> None:
+        """Send the control calls collected during the last loop iteration."""
+        pending, self._pending_controls = self._pending_controls, []
+        task = asyncio.get_running_loop().create_task(self._async_send_controls(pending))
+        self._control_flushes.add(task)
+        task.add_done_callback(self._control_flushes.discard)
+
+    async def _async_send_controls(self, pending: list[tuple[CompoundCall, asyncio.Future[Any]]]) -> None:
+        """Send control calls, in one compound request when there are several."""
+        calls = [call for call, _ in pending]
+        try:
+            if len(calls) > 1 and self.supports_compound:
+                results = await self.async_compound(calls)
+            else:
+                results = await asyncio.gather(
+                    *(self.async_request(call.api, call.method, call.params) for call in calls),
+                    return_exceptions=True,
+                )
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            results = [err] * len(calls)
+
+        for (_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def remote_player_volume(self, player_id: str, volume: int) -> bool:
+        """Set the volume of a remote player, range 0..100."""
+        return await self._async_control(player_id, "set_volume", volume)
+
+    async def remote_player_shuffle(self, player_id: str, shuffle: bool) -> bool:
+        """Enable/disable shuffle on a remote player."""
+        return await self._async_control(player_id, "set_shuffle", json.dumps(shuffle))
+
+    async def remote_player_repeat(self, player_id: str, repeat: RepeatMode) -> bool:
+        """Set the repeat mode of a remote player."""
+        return await self._async_control(player_id, "set_repeat", repeat.value)
+
+    async def remote_player_jump_to_song(self, player_id: str, position: int) -> bool:
+        """Play the song at a position of the current queue."""
+        return await self.remote_player_control(player_id, RemotePlayerAction.play, position)
+
+    async def _async_queue_total(self, player_id: str) -> int:
+        """Return the number of songs queued on a remote player."""
+        status = await self.async_request(API_REMOTE_PLAYER, "getstatus", {"id": player_id})
+        return status.get("playlist_total", 0)
+
+    async def _async_update_playlist(
+            self,
+            player_id: str,
+            mode: QueueMode,
+            play_directly: bool,
+            songs: str = "",
+            containers: list[dict[str, Any]] | None = None,
+            queue_total: int | None = None,
+    ) -> bool:
+        """Replace or append to the queue of a remote player.
+
+        The current queue length is read from the player unless given.
+        """
+        if queue_total is None:
+            queue_total = await self._async_queue_total(player_id)
+        offset, limit = (queue_total, 0) if mode == QueueMode.append else (0, queue_total)
+
+        params = {
+            "id": player_id,
+            "library": LIBRARY_SHARED,
+            "offset": offset,
+            "limit": limit,
+            "play": json.dumps(play_directly),
+            "songs": songs,
+            "updated_index": -1,
+        }
+        if containers:
+            params["containers_json"] = json.dumps(containers)
+        await self.async_request(API_REMOTE_PLAYER, "updateplaylist", params)
+        return True
+
+    async def remote_player_play_songs(
+            self, player_id: str, songs: str, mode: QueueMode, play_directly: bool
+    ) -> bool:
+        """Queue songs by id (comma separated) on a remote player."""
+        return await self._async_update_playlist(player_id, mode, play_directly, songs=songs)
+
+    async def remote_player_queue_songs(
+            self,
+            player_id: str,
+            song_ids: list[str],
+            mode: QueueMode,
+            play_directly: bool,
+            queue_total: int | None = None,
+    ) -> int:
+        """Queue songs by id on a remote player and return the new queue length.
+
+        Passing the current queue length when it is known saves a status read.
+        """
+        if queue_total is None:
+            queue_total = await self._async_queue_total(player_id)
+        await self._async_update_playlist(
+            player_id, mode, play_directly, songs=",".join(song_ids), queue_total=queue_total
+        )
+        return queue_total + len(song_ids) if mode == QueueMode.append else len(song_ids)
+
+    async def remote_player_play_artist(
+            self,
+            player_id: str,
+            artist: str,
+            sort: SongSortMode,
+            mode: QueueMode,
+            play_directly: bool,
+    ) -> bool:
+        """Queue all songs of an artist on a remote player."""
+        container = {"type": "artist", "sort_by": sort.value, "sort_direction": "ASC", "artist": artist}
+        return await self._async_update_playlist(player_id, mode, play_directly, containers=[container])
+
+    async def remote_player_play_album(
+            self,
+            player_id: str,
+            album_name: str,
+            album_artist: str,
+            sort: SongSortMode,
+            mode: QueueMode,
+            play_directly: bool,
+    ) -> bool:
+        """Queue all songs of an album on a remote player."""
+        container = {
+            "type": "album",
+            "sort_by": sort.value,
+            "sort_direction": "ASC",
+            "album": album_name,
+            "album_artist": album_artist,
+        }
+        return await self._async_update_playlist(player_id, mode, play_directly, containers=[container])
+
+    async def remote_player_get_playlist(self, player_id: str, offset: int, limit: int) -> dict[str, Any]:
+        """Fetch one page of the queue of a remote player, with the queue length as total."""
+        return await self.async_request(
+            API_REMOTE_PLAYER,
+            "getplaylist",
+            {"id": player_id, "offset": offset, "limit": limit, "additional": PLAYLIST_ADDITIONAL},
+        )
+
+    async def remote_player_clear_playlist(self, player_id: str) -> bool:
+        """Remove all songs from the queue of a remote player."""
+        return await self._async_update_playlist(player_id, QueueMode.replace, False)
@@ -0,0 +1,175 @@
+"""Benchmark the polling and command paths against the fake NAS.
+
+Drives SynoApi, its remote player coordinator and SynologyDlnaMediaPlayer
+entities in a bare Home Assistant instance against benchmarks/fake_dsm.py,
+and reports per player count:
+
+- poll cycle: wall time to fetch the status of every player
+- requests/cycle: HTTP requests the NAS received per cycle
+- executor: utilisation of the thread pool of the NAS since setup, and the
+  jobs it ran while polling
+- command: latency of a pause command issued through the entity, optionally
+  while --bulk-load library reads keep the NAS busy
+
+Needs the development requirements (homeassistant, aiohttp) installed:
+
+    python benchmarks/bench_polling.py --players 1 10 100 --latency 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+from pathlib import Path
+from statistics import median, quantiles
+import sys
+import tempfile
+from time import monotonic
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_SSL, CONF_USERNAME, CONF_VERIFY_SSL
+from homeassistant.core import HomeAssistant
+
+sys.path.insert(0, str(Path(__file__).parent))
+from fake_dsm import FakeDSM, FakeDSMConfig, async_start  # noqa: E402 pylint: disable=wrong-import-position
+
+INTEGRATION_ROOT = Path(__file__).parent.parent
+PACKAGE = "synology_dsaudio"
+
+
+def load_integration() -> None:
+    """Import the integration from this checkout, whatever the directory is called."""
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE, INTEGRATION_ROOT / "__init__.py", submodule_search_locations=[str(INTEGRATION_ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = module
+    spec.loader.exec_module(module)
+
+
+def _summary(samples: list[float]) -> str:
+    """Format the median and 95th percentile of samples in milliseconds."""
+    if len(samples) < 2:
+        return f"{samples[0] * 1000:8.1f} ms" if samples else "n/a"
+    p95 = quantiles(samples, n=20)[-1]
+    return f"{median(samples) * 1000:7.1f} / {p95 * 1000:7.1f} ms"
+
+
+async def async_bench(players: int, args: argparse.Namespace) -> dict[str, str]:
+    """Run the benchmark for one player count."""
+    # pylint: disable=import-outside-toplevel
+    from synology_dsaudio.api.SynoApi import SynoApi
+    from synology_dsaudio.const import API_KEY_REMOTE_PLAYER, DOMAIN, SYNO_API
+    from synology_dsaudio.media_player import SynologyDlnaMediaPlayer
+    from synology_dsaudio.scheduler import RequestPriority, request_priority
+
+    dsm = FakeDSM(FakeDSMConfig(players, args.latency, args.jitter, args.error_rate))
+    runner, port = await async_start(dsm)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+        entry = ConfigEntry(
+            version=1,
+            domain=DOMAIN,
+            title="Fake NAS",
+            data={
+                CONF_HOST: "127.0.0.1",
+                CONF_PORT: port,
+                CONF_SSL: False,
+                CONF_VERIFY_SSL: False,
+                CONF_USERNAME: "bench",
+                CONF_PASSWORD: "bench",
+            },
+            source="user",
+        )
+        try:
+            api = SynoApi(hass, entry)
+            await api.async_setup()
+            hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {SYNO_API: api}
+            coordinator = api.remote_player_coordinator
+            player_ids = [player.id for player in api.players]
+            for player_id in player_ids:
+                api.subscribe(API_KEY_REMOTE_PLAYER, player_id)
+
+            dsm.reset_counters()
+            jobs = api.executor.run_time.calls
+            cycles: list[float] = []
+            for _ in range(args.cycles):
+                cycle_started = monotonic()
+                await coordinator.async_refresh_players(player_ids)
+                cycles.append(monotonic() - cycle_started)
+            requests_per_cycle = dsm.http_requests / args.cycles
+            executor = api.executor.as_dict()["executor"]
+            executor_jobs = api.executor.run_time.calls - jobs
+
+            entities = []
+            for player in api.players[: args.command_players]:
+                entity = SynologyDlnaMediaPlayer(api, coordinator, player)
+                entity.hass = hass
+                entity.entity_id = f"media_player.bench_{len(entities)}"
+                entities.append(entity)
+
+            async def async_bulk_reads() -> None:
+                with request_priority(RequestPriority.BULK):
+                    while True:
+                        await api.audio_station.library_list("SYNO.AudioStation.Song", 0, 1)
+
+            bulk = [asyncio.create_task(async_bulk_reads()) for _ in range(args.bulk_load)]
+            commands: list[float] = []
+            try:
+                for _ in range(args.commands):
+                    for entity in entities:
+                        command_started = monotonic()
+                        await entity.async_media_pause()
+                        commands.append(monotonic() - command_started)
+            finally:
+                for task in bulk:
+                    task.cancel()
+                await asyncio.gather(*bulk, return_exceptions=True)
+            await hass.async_block_till_done()
+        finally:
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+    return {
+        "players": str(players),
+        "poll cycle (p50 / p95)": _summary(cycles),
+        "requests/cycle": f"{requests_per_cycle:.1f}",
+        "executor": f"{executor['utilisation']:.1f}% ({executor_jobs} jobs)",
+        "command (p50 / p95)": _summary(commands),
+    }
+
+
+def _print_table(rows: list[dict[str, str]]) -> None:
+    """Print results as an aligned table."""
+    columns = list(rows[0])
+    widths = {column: max(len(column), *(len(row[column]) for row in rows)) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    print("  ".join("-" * widths[column] for column in columns))
+    for row in rows:
+        print("  ".join(row[column].ljust(widths[column]) for column in columns))
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark for every player count."""
+    load_integration()
+    _print_table([await async_bench(players, args) for players in args.players])
+
+
+def main() -> None:
+    """Parse the arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--latency", type=float, default=20, help="mean NAS response time in ms")
+    parser.add_argument("--jitter", type=float, default=5, help="spread of the NAS response time in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of NAS calls failing, 0..1")
+    parser.add_argument("--cycles", type=int, default=20, help="poll cycles to measure")
+    parser.add_argument("--commands", type=int, default=10, help="commands to send per measured player")
+    parser.add_argument("--command-players", type=int, default=5, help="players receiving commands")
+    parser.add_argument("--bulk-load", type=int, default=0, help="library reads kept in flight while commanding")
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""Local stand-in for a Synology NAS running Audio Station.
+
+Implements just enough of the DSM web API for the integration: API
+discovery, login/logout, SYNO.DSM.Info, SYNO.AudioStation.RemotePlayer
+(list, getstatus, getplaylist, control, updateplaylist), SYNO.Entry.Request compound
+requests and empty library listings. Player count, response latency and
+error rate are configurable, and every request is counted.
+
+Run it standalone to point a development instance of Home Assistant at it:
+
+    python benchmarks/fake_dsm.py --players 10 --latency 50 --error-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import random
+import secrets
+from typing import Any
+
+from aiohttp import web
+
+SESSION_ERROR = 119
+UNKNOWN_ERROR = 100
+
+# API name: (cgi path, max version)
+APIS = {
+    "SYNO.API.Info": ("query.cgi", 1),
+    "SYNO.API.Auth": ("auth.cgi", 6),
+    "SYNO.DSM.Info": ("entry.cgi", 2),
+    "SYNO.Entry.Request": ("entry.cgi", 1),
+    "SYNO.AudioStation.RemotePlayer": ("AudioStation/remote_player.cgi", 3),
+    "SYNO.AudioStation.Song": ("AudioStation/song.cgi", 3),
+    "SYNO.AudioStation.Album": ("AudioStation/album.cgi", 3),
+    "SYNO.AudioStation.Artist": ("AudioStation/artist.cgi", 4),
+    "SYNO.AudioStation.Genre": ("AudioStation/genre.cgi", 3),
+    "SYNO.AudioStation.Folder": ("AudioStation/folder.cgi", 3),
+    "SYNO.AudioStation.Playlist": ("AudioStation/playlist.cgi", 3),
+    "SYNO.AudioStation.Cover": ("AudioStation/cover.cgi", 3),
+}
+LIBRARY_KEYS = {
+    "SYNO.AudioStation.Song": "songs",
+    "SYNO.AudioStation.Album": "albums",
+    "SYNO.AudioStation.Artist": "artists",
+    "SYNO.AudioStation.Genre": "genres",
+    "SYNO.AudioStation.Folder": "items",
+    "SYNO.AudioStation.Playlist": "playlists",
+}
+
+
+def _song(index: int) -> dict[str, Any]:
+    """Return a song as the Song and RemotePlayer APIs describe it."""
+    return {
+        "id": f"music_{index}",
+        "path": f"/music/Artist {index % 7}/Album {index % 13}/{index:04d}.flac",
+        "title": f"Song {index}",
+        "type": "file",
+        "additional": {
+            "song_audio": {"bitrate": 1411000, "codec": "flac", "container": "flac", "duration": 240,
+                           "filesize": 40000000, "frequency": 44100, "channel": 2},
+            "song_tag": {"album": f"Album {index % 13}", "album_artist": f"Artist {index % 7}",
+                         "artist": f"Artist {index % 7}", "comment": "", "composer": "", "disc": 1,
+                         "genre": "Rock", "track": index % 12 + 1, "year": 2000 + index % 20},
+        },
+    }
+
+
+@dataclass
+class FakePlayer:
+    """State of one remote player."""
+
+    player_id: str
+    name: str
+    state: str = "stopped"
+    volume: int = 50
+    index: int = 0
+    playlist_total: int = 20
+    playlist_timestamp: int = 1
+    shuffle: bool = False
+    repeat: str = "none"
+    position: int = 0
+
+    def as_player(self) -> dict[str, Any]:
+        """Return the player as the list method describes it."""
+        return {
+            "id": self.player_id,
+            "name": self.name,
+            "type": "upnp",
+            "is_multiple": False,
+            "password_protected": False,
+            "support_seek": True,
+            "support_set_volume": True,
+            "additional": {"subplayer_list": []},
+        }
+
+    def as_status(self) -> dict[str, Any]:
+        """Return the status as the getstatus method describes it."""
+        return {
+            "index": self.index,
+            "play_mode": {"repeat": self.repeat, "shuffle": self.shuffle},
+            "playlist_timestamp": self.playlist_timestamp,
+            "playlist_total": self.playlist_total,
+            "position": self.position,
+            "song": _song(self.index) if self.playlist_total else None,
+            "state": self.state,
+            "stop_index": 0,
+            "subplayer_volume": None,
+            "volume": self.volume,
+        }
+
+    def control(self, action: str, value: str | None) -> None:
+        """Apply a control command."""
+        if action in ("play", "pause", "stop"):
+            self.state = {"play": "playing", "pause": "pause", "stop": "stopped"}[action]
+        elif action == "next":
+            self.index = (self.index + 1) % max(self.playlist_total, 1)
+        elif action == "prev":
+            self.index = max(self.index - 1, 0)
+        elif action == "set_volume":
+            self.volume = int(value)
+        elif action == "set_shuffle":
+            self.shuffle = value == "true"
+        elif action == "set_repeat":
+            self.repeat = value
+        elif action == "seek":
+            self.position = int(float(value) * 1000)
+
+
+@dataclass
+class FakeDSMConfig:
+    """How the fake NAS behaves."""
+
+    players: int = 10
+    # Mean and spread of the time spent answering a request
+    latency_ms: float = 20
+    jitter_ms: float = 5
+    # Share of API calls answering with an error
+    error_rate: float = 0.0
+    serial: str = "FAKE00001"
+
+
+@dataclass
+class FakeDSM:
+    """The fake NAS, its players and request counters."""
+
+    config: FakeDSMConfig
+    players: dict[str, FakePlayer] = field(default_factory=dict)
+    sessions: set[str] = field(default_factory=set)
+    requests: Counter = field(default_factory=Counter)
+    http_requests: int = 0
+
+    def __post_init__(self) -> None:
+        """Create the players."""
+        for index in range(self.config.players):
+            player_id = f"uuid:{index:08d}-fake-player"
+            self.players[player_id] = FakePlayer(player_id, f"Player {index}", state="playing" if index % 2 else "stopped")
+
+    def reset_counters(self) -> None:
+        """Start counting requests from zero."""
+        self.requests.clear()
+        self.http_requests = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Answer one HTTP request of the web API."""
+        self.http_requests += 1
+        if self.config.latency_ms:
+            delay = random.gauss(self.config.latency_ms, self.config.jitter_ms)
+            await asyncio.sleep(max(delay, 0) / 1000)
+
+        params = dict(await request.post())
+        params.update(request.query)
+        return web.json_response(self.call(params, request.headers.get("X-SYNO-TOKEN")))
+
+    def call(self, params: dict[str, Any], syno_token: str | None = None) -> dict[str, Any]:
+        """Run one API method."""
+        api, method = params.get("api"), params.get("method")
+        self.requests[f"{api}.{method}"] += 1
+        if api not in APIS:
+            return {"success": False, "error": {"code": 102}}
+
+        if api == "SYNO.API.Info":
+            return {
+                "success": True,
+                "data": {
+                    name: {"path": path, "minVersion": 1, "maxVersion": version}
+                    for name, (path, version) in APIS.items()
+                },
+            }
+        if api == "SYNO.API.Auth" and method == "login":
+            sid = secrets.token_hex(12)
+            self.sessions.add(sid)
+            return {"success": True, "data": {"sid": sid, "synotoken": secrets.token_hex(8)}}
+
+        if params.get("_sid") not in self.sessions:
+            return {"success": False, "error": {"code": SESSION_ERROR}}
+        if api == "SYNO.API.Auth" and method == "logout":
+            self.sessions.discard(params["_sid"])
+            return {"success": True}
+        if api == "SYNO.Entry.Request":
+            return self._compound(params)
+
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            return {"success": False, "error": {"code": UNKNOWN_ERROR}}
+        if api == "SYNO.DSM.Info":
+            return {
+                "success": True,
+                "data": {"model": "DS-FAKE", "serial": self.config.serial, "version_string": "DSM 7.2-64570"},
+            }
+        if api == "SYNO.AudioStation.RemotePlayer":
+            return self._remote_player(method, params)
+        if api in LIBRARY_KEYS:
+            return {"success": True, "data": {"offset": 0, "total": 0, LIBRARY_KEYS[api]: []}}
+        return {"success": False, "error": {"code": 103}}
+
+    def _compound(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run the calls of a compound request in order."""
+        results = []
+        for call in json.loads(params["compound"]):
+            result = self.call({**{key: str(value) for key, value in call.items()}, "_sid": params["_sid"]})
+            results.append({"api": call["api"], "method": call["method"], **result})
+        return {
+            "success": True,
+            "data": {"has_fail": any(not result["success"] for result in results), "result": results},
+        }
+
+    def _remote_player(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Run a RemotePlayer method."""
+        if method == "list":
+            return {"success": True, "data": {"players": [player.as_player() for player in self.players.values()]}}
+        if (player := self.players.get(params.get("id"))) is None:
+            return {"success": False, "error": {"code": 0x1f5}}
+        if method == "getstatus":
+            return {"success": True, "data": player.as_status()}
+        if method == "getplaylist":
+            offset, limit = int(params.get("offset", 0)), int(params.get("limit", 0))
+            songs = [_song(index) for index in range(offset, min(offset + limit, player.playlist_total))]
+            return {
+                "success": True,
+                "data": {"current": player.index, "offset": offset, "songs": songs,
+                         "timestamp": player.playlist_timestamp, "total": player.playlist_total},
+            }
+        if method == "control":
+            player.control(params.get("action"), params.get("value"))
+            return {"success": True}
+        if method == "updateplaylist":
+            songs = [song for song in params.get("songs", "").split(",") if song]
+            offset, limit = int(params.get("offset", 0)), int(params.get("limit", 0))
+            player.playlist_total = max(player.playlist_total - limit, 0) + len(songs) if offset else len(songs)
+            player.playlist_timestamp += 1
+            return {"success": True}
+        return {"success": False, "error": {"code": 103}}
+
+
+def create_app(dsm: FakeDSM) -> web.Application:
+    """Create the web application serving the fake NAS."""
+    app = web.Application()
+    app.router.add_route("*", "/webapi/{path:.*}", dsm.handle)
+    return app
+
+
+async def async_start(dsm: FakeDSM, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, int]:
+    """Serve the fake NAS, returning the runner and the port it listens on."""
+    runner = web.AppRunner(create_app(dsm), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+
+
+def main() -> None:
+    """Run the fake NAS until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=20, help="mean response time in ms")
+    parser.add_argument("--jitter", type=float, default=5, help="spread of the response time in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of calls failing, 0..1")
+    args = parser.parse_args()
+
+    dsm = FakeDSM(FakeDSMConfig(args.players, args.latency, args.jitter, args.error_rate))
+    web.run_app(create_app(dsm), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
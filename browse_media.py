@@ -0,0 +1,360 @@
+"""Browse the Audio Station library from the media browser."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial
+import json
+from time import monotonic
+from typing import Any
+
+from homeassistant.components.media_player.browse_media import BrowseMedia
+from homeassistant.components.media_player.const import MediaClass, MediaType
+from homeassistant.components.media_player.errors import BrowseError
+
+from .api.SynoAudioStationClient import (
+    API_ALBUM,
+    API_ARTIST,
+    API_FOLDER,
+    API_GENRE,
+    API_PLAYLIST,
+    API_SONG,
+    LIBRARY_SHARED,
+    SONG_ADDITIONAL,
+    SynoAudioStationClient,
+)
+from .executor import ExecutorBusyError
+from .library import SynologyDSMLibraryIndex
+
+BROWSE_PAGE_SIZE = 100
+# Recently viewed pages are kept briefly, going back and forth is free
+BROWSE_CACHE_TTL = 60  # sec
+BROWSE_CACHE_SIZE = 64  # pages
+
+MEDIA_TYPE_LIBRARY = "library"
+MEDIA_TYPE_ARTISTS = "artists"
+MEDIA_TYPE_ALBUMS = "albums"
+MEDIA_TYPE_GENRES = "genres"
+MEDIA_TYPE_FOLDER = "folder"
+MEDIA_TYPE_PLAYLISTS = "playlists"
+
+LIBRARY_ROOTS = (
+    (MEDIA_TYPE_ARTISTS, "Artists"),
+    (MEDIA_TYPE_ALBUMS, "Albums"),
+    (MEDIA_TYPE_GENRES, "Genres"),
+    (MEDIA_TYPE_FOLDER, "Folders"),
+    (MEDIA_TYPE_PLAYLISTS, "Playlists"),
+)
+
+
+def page_content_id(value: str, offset: int = 0) -> str:
+    """Build a content id pointing to one page of a level."""
+    return f"{offset}/{value}"
+
+
+def parse_content_id(content_id: str) -> tuple[str, int]:
+    """Split a content id in the browsed value and the page offset."""
+    offset, _, value = content_id.partition("/")
+    if not offset.isdigit():
+        return content_id, 0
+    return value, int(offset)
+
+
+def album_value(name: str, album_artist: str) -> str:
+    """Identify an album, names are only unique per album artist."""
+    return json.dumps([name, album_artist])
+
+
+def parse_album_value(value: str) -> tuple[str, str]:
+    """Return the name and album artist of an album value."""
+    name, album_artist = json.loads(value)
+    return name, album_artist
+
+
+def _item(
+        media_class: MediaClass,
+        media_type: str,
+        value: str,
+        title: str,
+        can_play: bool,
+        can_expand: bool = True,
+) -> BrowseMedia:
+    """Build a child pointing to the first page of a level."""
+    return BrowseMedia(
+        media_class=media_class,
+        media_content_id=value if not can_expand else page_content_id(value),
+        media_content_type=media_type,
+        title=title or "Unknown",
+        can_play=can_play,
+        can_expand=can_expand,
+    )
+
+
+def _song(song: dict[str, Any]) -> BrowseMedia:
+    """Build a playable song."""
+    return _item(MediaClass.TRACK, MediaType.TRACK, song["id"], song.get("title"), True, False)
+
+
+class SynologyDSMMediaBrowser:
+    """Browse the library of a NAS one page at a time.
+
+    Artists, albums and genres come from the local library index once it is
+    synced, only folders and playlists are listed by the NAS.
+    """
+
+    def __init__(self, client: SynoAudioStationClient, library: SynologyDSMLibraryIndex) -> None:
+        """Initialize the browser."""
+        self._client = client
+        self._library = library
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._handlers: dict[str, Callable[[str, int], Awaitable[BrowseMedia]]] = {
+            MEDIA_TYPE_ARTISTS: self._async_browse_artists,
+            MediaType.ARTIST: self._async_browse_artist,
+            MEDIA_TYPE_ALBUMS: self._async_browse_albums,
+            MediaType.ALBUM: self._async_browse_album,
+            MEDIA_TYPE_GENRES: self._async_browse_genres,
+            MediaType.GENRE: self._async_browse_genre,
+            MEDIA_TYPE_FOLDER: self._async_browse_folder,
+            MEDIA_TYPE_PLAYLISTS: self._async_browse_playlists,
+            MediaType.PLAYLIST: self._async_browse_playlist,
+        }
+
+    async def _async_fetch(self, api: str, method: str, params: dict[str, Any]) -> Any:
+        """Fetch a page, from the cache when it was viewed recently."""
+        key = json.dumps([api, method, params], sort_keys=True)
+        if (cached := self._cache.get(key)) is not None and monotonic() - cached[0] < BROWSE_CACHE_TTL:
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        data = await self._client.async_request(api, method, params)
+        self._cache[key] = (monotonic(), data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > BROWSE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return data
+
+    async def _async_list(self, api: str, offset: int, **params: Any) -> dict[str, Any]:
+        """Fetch one page of a library listing."""
+        return await self._async_fetch(
+            api,
+            "list",
+            {"library": LIBRARY_SHARED, "offset": offset, "limit": BROWSE_PAGE_SIZE, **params},
+        )
+
+    async def _async_list_indexed(
+            self, indexed: Callable[..., Awaitable[dict[str, Any]]], api: str, offset: int, **params: Any
+    ) -> dict[str, Any]:
+        """Fetch one page of a library listing from the index, from the NAS while it is not synced yet."""
+        if self._library.ready:
+            try:
+                return await indexed(offset=offset, limit=BROWSE_PAGE_SIZE)
+            except ExecutorBusyError:
+                pass
+        return await self._async_list(api, offset, **params)
+
+    async def async_browse(self, media_content_type: str | None, media_content_id: str | None) -> BrowseMedia:
+        """Return one page of the given level, or the library root."""
+        if not media_content_type or media_content_type == MEDIA_TYPE_LIBRARY:
+            return self._root()
+        if (handler := self._handlers.get(media_content_type)) is None:
+            raise BrowseError(f"Media not found: {media_content_type} / {media_content_id}")
+        value, offset = parse_content_id(media_content_id or "")
+        return await handler(value, offset)
+
+    @staticmethod
+    def _root() -> BrowseMedia:
+        """Return the library root."""
+        return BrowseMedia(
+            media_class=MediaClass.DIRECTORY,
+            media_content_id="",
+            media_content_type=MEDIA_TYPE_LIBRARY,
+            title="Audio Station",
+            can_play=False,
+            can_expand=True,
+            children=[
+                _item(MediaClass.DIRECTORY, media_type, "", title, False)
+                for media_type, title in LIBRARY_ROOTS
+            ],
+            children_media_class=MediaClass.DIRECTORY,
+        )
+
+    @staticmethod
+    def _page(
+            media_class: MediaClass,
+            media_type: str,
+            value: str,
+            title: str,
+            offset: int,
+            total: int,
+            children: list[BrowseMedia],
+            children_media_class: MediaClass,
+            can_play: bool = False,
+    ) -> BrowseMedia:
+        """Build a page of a level, with a link to the next page if there is one."""
+        remaining = total - offset - len(children)
+        if remaining > 0:
+            children.append(
+                BrowseMedia(
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_id=page_content_id(value, offset + len(children)),
+                    media_content_type=media_type,
+                    title=f"More ({remaining})",
+                    can_play=False,
+                    can_expand=True,
+                )
+            )
+        return BrowseMedia(
+            media_class=media_class,
+            media_content_id=page_content_id(value, offset),
+            media_content_type=media_type,
+            title=title,
+            can_play=can_play,
+            can_expand=True,
+            children=children,
+            children_media_class=children_media_class,
+        )
+
+    def _albums_page(
+            self, data: dict[str, Any], media_class: MediaClass, media_type: str, value: str, title: str,
+            offset: int, can_play: bool = False,
+    ) -> BrowseMedia:
+        """Build a page listing albums."""
+        children = [
+            _item(
+                MediaClass.ALBUM,
+                MediaType.ALBUM,
+                album_value(album.get("name", ""), album.get("album_artist", "")),
+                album.get("name"),
+                True,
+            )
+            for album in data.get("albums", [])
+        ]
+        return self._page(
+            media_class, media_type, value, title, offset, data.get("total", 0), children, MediaClass.ALBUM,
+            can_play,
+        )
+
+    async def _async_browse_artists(self, value: str, offset: int) -> BrowseMedia:
+        """List artists."""
+        data = await self._async_list_indexed(
+            self._library.async_list_artists, API_ARTIST, offset, sort_by="name", sort_direction="ASC"
+        )
+        children = [
+            _item(MediaClass.ARTIST, MediaType.ARTIST, artist.get("name", ""), artist.get("name"), True)
+            for artist in data.get("artists", [])
+        ]
+        return self._page(
+            MediaClass.DIRECTORY, MEDIA_TYPE_ARTISTS, value, "Artists", offset, data.get("total", 0), children,
+            MediaClass.ARTIST,
+        )
+
+    async def _async_browse_artist(self, value: str, offset: int) -> BrowseMedia:
+        """List the albums of an artist."""
+        data = await self._async_list_indexed(
+            partial(self._library.async_list_albums, artist=value),
+            API_ALBUM,
+            offset,
+            artist=value,
+            sort_by="year",
+            sort_direction="ASC",
+        )
+        return self._albums_page(data, MediaClass.ARTIST, MediaType.ARTIST, value, value or "Unknown", offset, True)
+
+    async def _async_browse_albums(self, value: str, offset: int) -> BrowseMedia:
+        """List albums."""
+        data = await self._async_list_indexed(
+            self._library.async_list_albums, API_ALBUM, offset, sort_by="name", sort_direction="ASC"
+        )
+        return self._albums_page(data, MediaClass.DIRECTORY, MEDIA_TYPE_ALBUMS, value, "Albums", offset)
+
+    async def _async_browse_album(self, value: str, offset: int) -> BrowseMedia:
+        """List the songs of an album."""
+        name, album_artist = parse_album_value(value)
+        data = await self._async_list_indexed(
+            partial(self._library.async_list_songs, album=name, album_artist=album_artist),
+            API_SONG,
+            offset,
+            album=name,
+            album_artist=album_artist,
+            additional=SONG_ADDITIONAL,
+            sort_by="track",
+            sort_direction="ASC",
+        )
+        children = [_song(song) for song in data.get("songs", [])]
+        return self._page(
+            MediaClass.ALBUM, MediaType.ALBUM, value, name or "Unknown", offset, data.get("total", 0), children,
+            MediaClass.TRACK, can_play=True,
+        )
+
+    async def _async_browse_genres(self, value: str, offset: int) -> BrowseMedia:
+        """List genres."""
+        data = await self._async_list_indexed(
+            self._library.async_list_genres, API_GENRE, offset, sort_by="name", sort_direction="ASC"
+        )
+        children = [
+            _item(MediaClass.GENRE, MediaType.GENRE, genre.get("name", ""), genre.get("name"), False)
+            for genre in data.get("genres", [])
+        ]
+        return self._page(
+            MediaClass.DIRECTORY, MEDIA_TYPE_GENRES, value, "Genres", offset, data.get("total", 0), children,
+            MediaClass.GENRE,
+        )
+
+    async def _async_browse_genre(self, value: str, offset: int) -> BrowseMedia:
+        """List the albums of a genre."""
+        data = await self._async_list_indexed(
+            partial(self._library.async_list_albums, genre=value),
+            API_ALBUM,
+            offset,
+            genre=value,
+            sort_by="name",
+            sort_direction="ASC",
+        )
+        return self._albums_page(data, MediaClass.GENRE, MediaType.GENRE, value, value or "Unknown", offset)
+
+    async def _async_browse_folder(self, value: str, offset: int) -> BrowseMedia:
+        """List the sub folders and songs of a folder, the root folders without id."""
+        params = {"id": value} if value else {}
+        data = await self._async_list(API_FOLDER, offset, sort_by="title", sort_direction="ASC", **params)
+        children = [
+            _item(MediaClass.DIRECTORY, MEDIA_TYPE_FOLDER, item["id"], item.get("title"), False)
+            if item.get("type") == "folder" else _song(item)
+            for item in data.get("items", [])
+        ]
+        return self._page(
+            MediaClass.DIRECTORY, MEDIA_TYPE_FOLDER, value, data.get("folder_title") or "Folders", offset,
+            data.get("total", 0), children, MediaClass.DIRECTORY,
+        )
+
+    async def _async_browse_playlists(self, value: str, offset: int) -> BrowseMedia:
+        """List the shared and personal playlists."""
+        data = await self._async_list(API_PLAYLIST, offset, library="all")
+        children = [
+            _item(MediaClass.PLAYLIST, MediaType.PLAYLIST, playlist["id"], playlist.get("name"), False)
+            for playlist in data.get("playlists", [])
+        ]
+        return self._page(
+            MediaClass.DIRECTORY, MEDIA_TYPE_PLAYLISTS, value, "Playlists", offset, data.get("total", 0),
+            children, MediaClass.PLAYLIST,
+        )
+
+    async def _async_browse_playlist(self, value: str, offset: int) -> BrowseMedia:
+        """List the songs of a playlist."""
+        data = await self._async_fetch(
+            API_PLAYLIST,
+            "getinfo",
+            {
+                "id": value,
+                "library": "all",
+                "additional": "songs_song_tag,songs_song_audio",
+                "songs_offset": offset,
+                "songs_limit": BROWSE_PAGE_SIZE,
+            },
+        )
+        playlist = data["playlists"][0]
+        additional = playlist.get("additional", {})
+        children = [_song(song) for song in additional.get("songs", [])]
+        return self._page(
+            MediaClass.PLAYLIST, MediaType.PLAYLIST, value, playlist.get("name") or "Playlist", offset,
+            additional.get("songs_total", 0), children, MediaClass.TRACK,
+        )
@@ -24,6 +24,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_PASSWORD,
     CONF_PORT,
+    CONF_SCAN_INTERVAL,
     CONF_SSL,
     CONF_TIMEOUT,
     CONF_USERNAME,
@@ -37,8 +38,19 @@ from homeassistant.helpers.typing import DiscoveryInfoType
 from .shared import LOGGER
 from .const import (
     CONF_DEVICE_TOKEN,
+    CONF_EXECUTOR_QUEUE,
+    CONF_EXECUTOR_THREADS,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_IDLE_SCAN_INTERVAL,
+    DEFAULT_EXECUTOR_QUEUE,
+    DEFAULT_EXECUTOR_THREADS,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_IDLE_SCAN_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_PORT_SSL,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DEFAULT_USE_SSL,
     DEFAULT_VERIFY_SSL,
@@ -340,20 +352,62 @@ class SynologyDSMOptionsFlowHandler(OptionsFlow):
             self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle options flow."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if user_input[CONF_MAX_IDLE_SCAN_INTERVAL] < user_input[CONF_IDLE_SCAN_INTERVAL]:
+                errors[CONF_MAX_IDLE_SCAN_INTERVAL] = "max_idle_below_idle"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
+        # Show the rejected values again rather than the saved ones
+        options = {**self.config_entry.options, **(user_input or {})}
         data_schema = vol.Schema(
             {
                 vol.Required(
                     CONF_TIMEOUT,
-                    default=self.config_entry.options.get(
+                    default=options.get(
                         CONF_TIMEOUT, DEFAULT_TIMEOUT
                     ),
                 ): cv.positive_int,
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_IDLE_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_MAX_IDLE_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_IDLE_SCAN_INTERVAL, DEFAULT_MAX_IDLE_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=options.get(
+                        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                vol.Required(
+                    CONF_EXECUTOR_THREADS,
+                    default=options.get(
+                        CONF_EXECUTOR_THREADS, DEFAULT_EXECUTOR_THREADS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+                vol.Required(
+                    CONF_EXECUTOR_QUEUE,
+                    default=options.get(
+                        CONF_EXECUTOR_QUEUE, DEFAULT_EXECUTOR_QUEUE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(step_id="init", data_schema=data_schema, errors=errors)
 
 
 def _login_and_fetch_syno_info(api: SynologyDSM, otp_code: str) -> str:
@@ -4,6 +4,11 @@ VERSION = "1.0.0"
 CONF_SERIAL = "serial"
 CONF_DEVICE_TOKEN = "device_token"
 CONF_OTP_CODE = "otp_code"
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"
+CONF_MAX_IDLE_SCAN_INTERVAL = "max_idle_scan_interval"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_EXECUTOR_THREADS = "executor_threads"
+CONF_EXECUTOR_QUEUE = "executor_queue"
 
 # Defaults
 DEFAULT_USE_SSL = True
@@ -11,16 +16,28 @@ DEFAULT_VERIFY_SSL = False
 DEFAULT_PORT = 5000
 DEFAULT_PORT_SSL = 5001
 DEFAULT_TIMEOUT = 10  # sec
+DEFAULT_SCAN_INTERVAL = 10  # sec, while playing
+DEFAULT_IDLE_SCAN_INTERVAL = 30  # sec, first poll after a player went idle
+DEFAULT_MAX_IDLE_SCAN_INTERVAL = 300  # sec, idle polling backs off up to this
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4  # requests in flight per NAS
+DEFAULT_EXECUTOR_THREADS = 2  # threads for the library database and covers, per NAS
+DEFAULT_EXECUTOR_QUEUE = 32  # jobs waiting for one of those threads
+DEFAULT_MAX_BATCH_SIZE = 25  # calls per compound request
 
 EXCEPTION_DETAILS = "details"
 EXCEPTION_UNKNOWN = "unknown"
 
 SYNO_API = "syno_api"
 
+# API keys entities can subscribe to
+API_KEY_REMOTE_PLAYER = "SYNO.AudioStation.RemotePlayer"
+API_KEY_METRICS = "metrics"
+
 # Service keys
 
 SERVICE_FUNC_GETPLAYERS = "get_players"
 SERVICE_FUNC_GETPLAYER_STATUS = "get_player_status"
+SERVICE_FUNC_GET_PLAYER_QUEUE = "get_player_queue"
 SERVICE_FUNC_REMOTE_PLAY_SONGS = "remote_player_play_songs"
 SERVICE_FUNC_REMOTE_PLAY_ARTIST = "remote_player_play_artist"
 SERVICE_FUNC_REMOTE_PLAY_ALBUM = "remote_player_play_album"
@@ -29,6 +46,8 @@ SERVICE_FUNC_REMOTE_PLAYER_JUMP_TO_SONG = "remote_player_jump_to_song"
 SERVICE_FUNC_REMOTE_PLAYER_VOLUME = "remote_player_volume"
 SERVICE_FUNC_REMOTE_SHUFFLE = "remote_player_shuffle"
 SERVICE_FUNC_REMOTE_PLAYER_CLEAR_PLAYLIST = "remote_player_clear_playlist"
+SERVICE_FUNC_SEARCH_LIBRARY = "search_library"
+SERVICE_FUNC_PLAY_SEARCH = "play_search"
 
 # Service input keys
 SERVICE_INPUT_SONGS = "songs"
@@ -41,3 +60,7 @@ SERVICE_INPUT_PLAYER_ID = "player_id"
 SERVICE_INPUT_VOLUME = "volume"
 SERVICE_INPUT_SLEEP_TIMER = "sleep_timer"
 SERVICE_INPUT_SHUFFLE = "shuffle"
+SERVICE_INPUT_QUERY = "query"
+SERVICE_INPUT_LIMIT = "limit"
+SERVICE_INPUT_OFFSET = "offset"
+SERVICE_INPUT_QUEUE_MODE = "queue_mode"
@@ -0,0 +1,312 @@
+"""Coordinators for Synology DSM."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.dt import utcnow
+
+from .const import (
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_IDLE_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_IDLE_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+)
+from .scheduler import RequestPriority, request_priority
+from .shared import LOGGER
+from .synology_dsm.api.audio_station import RemotePlayerStatus
+from .synology_dsm.api.audio_station.models.playlist_status import PlaylistStatus
+from .synology_dsm.exceptions import (
+    SynologyDSMAPIErrorException,
+    SynologyDSMLoginFailedException,
+    SynologyDSMRequestException,
+)
+
+if TYPE_CHECKING:
+    from .api.SynoApi import SynoApi
+
+_DataT = TypeVar("_DataT")
+
+# Players in these states are polled at the fast interval, others back off
+ACTIVE_STATES = (PlaylistStatus.playing, PlaylistStatus.transitioning)
+
+MIN_UPDATE_INTERVAL = timedelta(seconds=1)
+# Refreshes are scheduled on a random microsecond, poll players due within it
+POLL_TOLERANCE = timedelta(seconds=1)
+# Give the NAS time to apply a command before reading the status back
+CONFIRMATION_DELAY = 1.5  # sec
+METRICS_UPDATE_INTERVAL = timedelta(minutes=1)
+
+
+class SynologyDSMUpdateCoordinator(DataUpdateCoordinator[_DataT]):
+    """DataUpdateCoordinator base class for synology_dsm."""
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            api: SynoApi,
+            update_interval: timedelta,
+    ) -> None:
+        """Initialize synology_dsm DataUpdateCoordinator."""
+        self.api = api
+        self.entry = entry
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"{entry.title} {self.__class__.__name__}",
+            update_interval=update_interval,
+        )
+
+
+class SynologyDSMRemotePlayerUpdateCoordinator(
+    SynologyDSMUpdateCoordinator[dict[str, RemotePlayerStatus]]
+):
+    """DataUpdateCoordinator to gather the status of all remote players of a NAS."""
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            api: SynoApi,
+    ) -> None:
+        """Initialize DataUpdateCoordinator for remote players."""
+        self._playing_interval = timedelta(
+            seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self._idle_interval = timedelta(
+            seconds=entry.options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL)
+        )
+        # Options saved before the flow checked them may still be inverted
+        self._max_idle_interval = max(
+            timedelta(seconds=entry.options.get(CONF_MAX_IDLE_SCAN_INTERVAL, DEFAULT_MAX_IDLE_SCAN_INTERVAL)),
+            self._idle_interval,
+        )
+        super().__init__(hass, entry, api, self._playing_interval)
+        self.data = {}
+
+        # When each player is due for its next poll, and its current idle backoff
+        self._next_poll: dict[str, datetime] = {}
+        self._idle_backoff: dict[str, timedelta] = {}
+
+        # Monotonic time the last fetch of each player started
+        self.poll_started: dict[str, float] = {}
+
+        # Players still showing the status restored from the last run
+        self.stale: set[str] = set()
+
+        # Status reads asked for by services, shared by concurrent callers
+        self._status_reads: dict[str, asyncio.Task[RemotePlayerStatus | None]] = {}
+
+        # Players waiting for a read confirming a command
+        self._pending_confirmations: set[str] = set()
+        self._unsub_confirmation: CALLBACK_TYPE | None = None
+        entry.async_on_unload(self._async_cancel_confirmation)
+
+    @callback
+    def async_restore(self, statuses: dict[str, RemotePlayerStatus]) -> None:
+        """Show the statuses known when hass stopped until the first poll."""
+        self.data = statuses
+        self.stale = set(statuses)
+
+    @callback
+    def async_remove_players(self, player_ids: set[str]) -> None:
+        """Forget players that vanished from the NAS, their entities become unavailable."""
+        for player_id in player_ids:
+            self._next_poll.pop(player_id, None)
+            self._idle_backoff.pop(player_id, None)
+            self.poll_started.pop(player_id, None)
+        self.stale.difference_update(player_ids)
+        self.async_set_updated_data(
+            {player_id: status for player_id, status in self.data.items() if player_id not in player_ids}
+        )
+
+    @callback
+    def _schedule_player(self, player_id: str, status: RemotePlayerStatus | None) -> None:
+        """Plan the next poll of a player from its play state.
+
+        A player that did not answer backs off like an idle one.
+        """
+        if status is not None and status.state in ACTIVE_STATES:
+            interval = self._playing_interval
+            self._idle_backoff.pop(player_id, None)
+        else:
+            interval = self._idle_backoff.get(player_id)
+            interval = self._idle_interval if interval is None else min(interval * 2, self._max_idle_interval)
+            self._idle_backoff[player_id] = interval
+        self._next_poll[player_id] = utcnow() + interval
+
+    @callback
+    def _schedule_next_cycle(self) -> None:
+        """Wake up when the first subscribed player is due."""
+        player_ids = self.api.remote_player_ids
+        next_polls = [self._next_poll[player_id] for player_id in player_ids if player_id in self._next_poll]
+        if not next_polls:
+            self.update_interval = self._playing_interval
+            return
+        self.update_interval = min(
+            max(min(next_polls) - utcnow(), MIN_UPDATE_INTERVAL), self._max_idle_interval
+        )
+
+    async def _async_fetch_statuses(
+            self, player_ids: Iterable[str]
+    ) -> dict[str, RemotePlayerStatus]:
+        """Fetch the status of the given players in as few requests as possible."""
+        results = await self.api.async_get_remote_player_statuses(player_ids)
+
+        statuses: dict[str, RemotePlayerStatus] = {}
+        errors: list[Exception] = []
+        for player_id, result in results.items():
+            if isinstance(result, SynologyDSMAPIErrorException):
+                # Player went away or is not reachable, only this entity is affected
+                LOGGER.debug("Unable to fetch status of player %s: %s", player_id, result)
+                continue
+            if isinstance(result, (SynologyDSMLoginFailedException, SynologyDSMRequestException)):
+                errors.append(result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            statuses[player_id] = result
+
+        if errors and not statuses:
+            self.api.async_report_failure(errors[0])
+            raise UpdateFailed(f"Error communicating with API: {errors[0]}") from errors[0]
+        self.api.supervisor.async_report_success()
+
+        return statuses
+
+    async def _async_poll(self, player_ids: list[str]) -> dict[str, RemotePlayerStatus]:
+        """Fetch some players, plan their next poll and return the merged data."""
+        started = monotonic()
+        for player_id in player_ids:
+            self.poll_started[player_id] = started
+        statuses = await self._async_fetch_statuses(player_ids)
+        for player_id in player_ids:
+            self._schedule_player(player_id, statuses.get(player_id))
+        self.stale.difference_update(player_ids)
+        self._schedule_next_cycle()
+
+        # Players that were polled but returned nothing are no longer available
+        data = {
+            player_id: status
+            for player_id, status in (self.data or {}).items()
+            if player_id not in player_ids
+        }
+        data.update(statuses)
+        return data
+
+    async def _async_update_data(self) -> dict[str, RemotePlayerStatus]:
+        """Fetch the status of all subscribed players that are due in one cycle."""
+        if not self.api.initialized:
+            # Still connecting in the background, keep the restored statuses
+            return self.data
+        if not self.api.supervisor.available:
+            raise UpdateFailed("NAS unreachable, reconnecting")
+
+        # Entities of vanished players stay subscribed, but are not polled until their player is back
+        known = {player.id for player in self.api.players}
+        now = utcnow() + POLL_TOLERANCE
+        due = [
+            player_id
+            for player_id in self.api.remote_player_ids & known
+            if self._next_poll.get(player_id, now) <= now
+        ]
+        if not due:
+            self._schedule_next_cycle()
+            return self.data
+        with request_priority(RequestPriority.POLL):
+            return await self._async_poll(due)
+
+    async def async_refresh_players(self, player_ids: Iterable[str]) -> None:
+        """Fetch the status of some players now and push it to the entities.
+
+        Used after a command, so the idle backoff of these players is reset.
+        """
+        player_ids = list(player_ids)
+        for player_id in player_ids:
+            self._idle_backoff.pop(player_id, None)
+        try:
+            data = await self._async_poll(player_ids)
+        except UpdateFailed as err:
+            LOGGER.debug("Unable to refresh players %s: %s", player_ids, err)
+            return
+        self.async_set_updated_data(data)
+
+    @callback
+    def is_fresh(self, player_id: str) -> bool:
+        """Return True if the cached status of a player is newer than one fast poll interval."""
+        return (
+            player_id in (self.data or {})
+            and player_id not in self.stale
+            and monotonic() - self.poll_started.get(player_id, 0) <= self._playing_interval.total_seconds()
+        )
+
+    async def async_get_status(self, player_id: str) -> RemotePlayerStatus | None:
+        """Return the status of a player, only reading it from the NAS when the cached one is not fresh."""
+        if self.is_fresh(player_id):
+            return self.data[player_id]
+        if (read := self._status_reads.get(player_id)) is None:
+            read = self._status_reads[player_id] = self.hass.async_create_task(self._async_read_status(player_id))
+            read.add_done_callback(lambda _: self._status_reads.pop(player_id, None))
+        return await asyncio.shield(read)
+
+    async def _async_read_status(self, player_id: str) -> RemotePlayerStatus | None:
+        """Poll one player and push its status to the entities."""
+        data = await self._async_poll([player_id])
+        self.async_set_updated_data(data)
+        return data.get(player_id)
+
+    @callback
+    def async_request_confirmation(self, player_id: str) -> None:
+        """Read a player back shortly after a command.
+
+        Requests arriving before the read is sent are coalesced into it.
+        """
+        self._pending_confirmations.add(player_id)
+        if self._unsub_confirmation is None:
+            self._unsub_confirmation = async_call_later(
+                self.hass, CONFIRMATION_DELAY, self._async_confirm
+            )
+
+    async def _async_confirm(self, _now: datetime) -> None:
+        """Send the coalesced confirmation read."""
+        self._unsub_confirmation = None
+        player_ids, self._pending_confirmations = self._pending_confirmations, set()
+        with request_priority(RequestPriority.CONFIRMATION):
+            await self.async_refresh_players(player_ids)
+
+    @callback
+    def _async_cancel_confirmation(self) -> None:
+        """Drop a pending confirmation read."""
+        if self._unsub_confirmation is not None:
+            self._unsub_confirmation()
+            self._unsub_confirmation = None
+
+
+class SynologyDSMMetricsUpdateCoordinator(
+    SynologyDSMUpdateCoordinator[dict[str, dict[str, Any]]]
+):
+    """DataUpdateCoordinator publishing the request and executor metrics, nothing is fetched from the NAS."""
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            api: SynoApi,
+    ) -> None:
+        """Initialize DataUpdateCoordinator for request and executor metrics."""
+        super().__init__(hass, entry, api, METRICS_UPDATE_INTERVAL)
+        self.data = {}
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of every API method and of the executor."""
+        return {**self.api.metrics.as_dict(), **self.api.executor.as_dict()}
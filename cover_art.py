@@ -0,0 +1,168 @@
+"""Album art fetched once per album and kept on disk."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+from time import monotonic
+
+from PIL import Image
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .api.SynoAudioStationClient import SynoAudioStationClient
+from .const import DOMAIN
+from .executor import BlockingExecutor, ExecutorBusyError
+from .shared import LOGGER
+from .synology_dsm.exceptions import SynologyDSMException
+
+# Longest side of the stored thumbnails, plenty for the frontend cards
+COVER_SIZE = 512  # px
+COVER_QUALITY = 85
+COVER_CONTENT_TYPE = "image/jpeg"
+# Least recently shown covers are removed beyond this size
+CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Albums without art are only asked for again after this long
+MISSING_COVER_TTL = 3600  # sec
+
+
+def cover_key(album: str, album_artist: str) -> str:
+    """Identify the cover of an album, names are only unique per album artist."""
+    return hashlib.sha256(json.dumps([album, album_artist]).encode()).hexdigest()
+
+
+def _thumbnail(data: bytes) -> bytes:
+    """Shrink a cover to the thumbnail size and encode it as JPEG."""
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail((COVER_SIZE, COVER_SIZE))
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, "JPEG", quality=COVER_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+class SynologyDSMCoverArtCache:
+    """Size bounded on-disk LRU cache of album cover thumbnails."""
+
+    def __init__(
+            self, hass: HomeAssistant, client: SynoAudioStationClient, executor: BlockingExecutor, serial: str
+    ) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._client = client
+        self._executor = executor
+        self._path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.{serial}.covers")
+
+        # Cached files and their size, least recently used first, loaded on first use
+        self._files: dict[str, int] | None = None
+        self._total_bytes = 0
+        self._files_lock = threading.Lock()
+
+        self._missing: dict[str, float] = {}
+        self._fetches: dict[str, asyncio.Task[tuple[bytes | None, str | None]]] = {}
+
+    async def async_get(self, album: str, album_artist: str) -> tuple[bytes | None, str | None]:
+        """Return the cover thumbnail of an album and its content type."""
+        key = cover_key(album, album_artist)
+        try:
+            data = await self._executor.async_run(self._read, key)
+        except ExecutorBusyError as err:
+            LOGGER.debug("Not serving the cover of %s - %s: %s", album_artist, album, err)
+            return None, None
+        if data is not None:
+            return data, COVER_CONTENT_TYPE
+
+        if (missing_since := self._missing.get(key)) is not None:
+            if monotonic() - missing_since < MISSING_COVER_TTL:
+                return None, None
+            del self._missing[key]
+
+        # Players showing the same album share one download
+        if (fetch := self._fetches.get(key)) is None:
+            fetch = self._fetches[key] = self._hass.async_create_task(
+                self._async_fetch(key, album, album_artist)
+            )
+            fetch.add_done_callback(lambda _: self._fetches.pop(key, None))
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(self, key: str, album: str, album_artist: str) -> tuple[bytes | None, str | None]:
+        """Download a cover from the NAS and store its thumbnail."""
+        try:
+            cover = await self._client.get_album_cover(album, album_artist)
+        except SynologyDSMException as err:
+            LOGGER.debug("Unable to fetch the cover of %s - %s: %s", album_artist, album, err)
+            return None, None
+
+        if cover is None:
+            self._missing[key] = monotonic()
+            return None, None
+        try:
+            return await self._executor.async_run(self._store, key, *cover)
+        except ExecutorBusyError:
+            # Shown once without resizing, stored next time
+            return cover
+
+    def _file(self, key: str) -> str:
+        """Return the path of a cached thumbnail."""
+        return os.path.join(self._path, f"{key}.jpg")
+
+    def _load_files(self) -> dict[str, int]:
+        """Scan the cache directory once, ordering the files by last use."""
+        if self._files is None:
+            entries = []
+            if os.path.isdir(self._path):
+                with os.scandir(self._path) as scan:
+                    entries = [entry for entry in scan if entry.name.endswith(".jpg")]
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            self._files = {entry.name: entry.stat().st_size for entry in entries}
+            self._total_bytes = sum(self._files.values())
+        return self._files
+
+    def _read(self, key: str) -> bytes | None:
+        """Read a cached thumbnail and mark it as recently used."""
+        path = self._file(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            # The modification time keeps the use order across restarts
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        with self._files_lock:
+            files = self._load_files()
+            name = os.path.basename(path)
+            files[name] = files.pop(name, len(data))
+        return data
+
+    def _store(self, key: str, data: bytes, content_type: str) -> tuple[bytes, str]:
+        """Store the thumbnail of a downloaded cover, evicting the least recently used ones."""
+        try:
+            thumbnail = _thumbnail(data)
+        except (OSError, ValueError) as err:
+            LOGGER.debug("Unable to resize cover %s, not caching it: %s", key, err)
+            return data, content_type
+
+        path = self._file(key)
+        os.makedirs(self._path, exist_ok=True)
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(thumbnail)
+        os.replace(f"{path}.tmp", path)
+
+        with self._files_lock:
+            files = self._load_files()
+            name = os.path.basename(path)
+            self._total_bytes += len(thumbnail) - files.pop(name, 0)
+            files[name] = len(thumbnail)
+            while self._total_bytes > CACHE_MAX_BYTES and len(files) > 1:
+                evicted = next(iter(files))
+                self._total_bytes -= files.pop(evicted)
+                try:
+                    os.remove(os.path.join(self._path, evicted))
+                except FileNotFoundError:
+                    pass
+
+        return thumbnail, COVER_CONTENT_TYPE
@@ -0,0 +1,52 @@
+"""Diagnostics support for Synology DSM Audio Station."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .api.SynoApi import SynoApi
+from .const import CONF_DEVICE_TOKEN, DOMAIN, SYNO_API
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_DEVICE_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+        hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    api: SynoApi = hass.data[DOMAIN][entry.entry_id][SYNO_API]
+    coordinator = api.remote_player_coordinator
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "device_info": {
+            "model": api.information.model,
+            "version": api.information.version_string,
+        },
+        "connection": {
+            "initialized": api.initialized,
+            "available": api.supervisor.available,
+            "connecting": api.supervisor.connecting,
+        },
+        "players": {
+            "known": len(api.players),
+            "polled": len(coordinator.data),
+            "stale": len(coordinator.stale),
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "last_update_success": coordinator.last_update_success,
+        },
+        "scheduler": {
+            "max_concurrent": api.scheduler.max_concurrent,
+            "waiting": api.scheduler.waiting,
+        },
+        "library_index_ready": api.library.ready,
+        "request_metrics": api.metrics.as_dict(),
+        "executor_metrics": api.executor.as_dict(),
+    }
@@ -10,8 +10,10 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .api import SynoApi
-from .const import DOMAIN
+from .api.SynoApi import SynoApi
+from .const import API_KEY_REMOTE_PLAYER, DOMAIN
+from .coordinator import SynologyDSMRemotePlayerUpdateCoordinator
+from .synology_dsm.api.audio_station import Player, RemotePlayerStatus
 
 
 @dataclass
@@ -45,13 +47,13 @@ class SynologyDSMBaseEntity(
         self.entity_description = description
 
         self._api = api
-        self._attr_name = f"{api.network.hostname} {description.name}"
+        self._attr_name = f"{api.name} {description.name}"
         self._attr_unique_id: str = (
             f"{api.information.serial}_{description.api_key}:{description.key}"
         )
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._api.information.serial)},
-            name=self._api.network.hostname,
+            name=self._api.name,
             manufacturer="Synology",
             model=self._api.information.model,
             sw_version=self._api.information.version_string,
@@ -66,3 +68,41 @@ class SynologyDSMBaseEntity(
         await super().async_added_to_hass()
 
 
+class SynologyDSMRemotePlayerEntity(
+    CoordinatorEntity[SynologyDSMRemotePlayerUpdateCoordinator]
+):
+    """Representation of a remote player of a Synology NAS."""
+
+    def __init__(
+        self,
+        api: SynoApi,
+        coordinator: SynologyDSMRemotePlayerUpdateCoordinator,
+        player: Player,
+    ) -> None:
+        """Initialize the Synology DSM remote player entity."""
+        super().__init__(coordinator)
+        self._api = api
+        self._player = player
+        self._attr_unique_id = str(player.id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, player.id)},
+            name=player.name,
+            via_device=(DOMAIN, api.information.serial),
+        )
+
+    @property
+    def _status(self) -> RemotePlayerStatus | None:
+        """Return the last fetched status of the player."""
+        return self.coordinator.data.get(self._player.id)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the NAS is reachable and the last poll returned a status for this player."""
+        return super().available and self._api.supervisor.available and self._status is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Register player for updates from API."""
+        self.async_on_remove(
+            self._api.subscribe(API_KEY_REMOTE_PLAYER, self._player.id)
+        )
+        await super().async_added_to_hass()
@@ -0,0 +1,121 @@
+"""Thread pool for the blocking work of one NAS, apart from the shared executor of Home Assistant."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic
+from typing import Any, TypeVar
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .metrics import METRICS_WINDOW, MethodMetrics
+
+_T = TypeVar("_T")
+
+
+class ExecutorBusyError(HomeAssistantError):
+    """Too many jobs are already waiting for a thread."""
+
+
+class BlockingExecutor:
+    """Run the blocking jobs of a NAS (library database, cover thumbnails) on a few threads of its own.
+
+    Jobs wait on the event loop until a thread is free, so a slow disk or a
+    huge library can only hold up this NAS. Beyond max_queue waiting jobs new
+    ones are refused instead of piling up.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        """Initialize the executor, threads are started on first use."""
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._threads = asyncio.Semaphore(max_workers)
+
+        self.running = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.queue_wait = MethodMetrics()
+        self.run_time = MethodMetrics()
+
+        # Seconds threads were busy in the current and the previous window
+        self._busy = 0.0
+        self._previous_busy = 0.0
+        self._window_started = monotonic()
+        self._previous_window = 0.0
+
+    async def async_run(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking function once a thread is free and return its result."""
+        if self._threads.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorBusyError(f"{self.waiting} jobs are already waiting for a thread")
+
+        queued = monotonic()
+        self.waiting += 1
+        try:
+            await self._threads.acquire()
+        finally:
+            self.waiting -= 1
+        self.queue_wait.record(monotonic() - queued, False)
+
+        loop = asyncio.get_running_loop()
+        started = monotonic()
+        self.running += 1
+        try:
+            job = self._pool.submit(target, *args)
+        except BaseException:
+            self._job_done(started, True)
+            raise
+        # The thread is only free once the job ended, even if the caller gave up waiting
+        job.add_done_callback(
+            lambda done: loop.call_soon_threadsafe(self._job_done, started, _failed(done))
+        )
+        return await asyncio.wrap_future(job)
+
+    @callback
+    def _job_done(self, started: float, failed: bool) -> None:
+        """Free the thread of a finished job and account for its run time."""
+        self.running -= 1
+        self._threads.release()
+        seconds = monotonic() - started
+        self.run_time.record(seconds, failed)
+
+        if (now := monotonic()) - self._window_started >= METRICS_WINDOW:
+            self._previous_busy, self._busy = self._busy, 0.0
+            self._previous_window = now - self._window_started
+            self._window_started = now
+        self._busy += seconds
+
+    @property
+    def utilisation(self) -> float:
+        """Return the share of thread time spent on jobs over the recent windows."""
+        elapsed = monotonic() - self._window_started + self._previous_window
+        if not elapsed:
+            return 0.0
+        return min(1.0, (self._busy + self._previous_busy) / (elapsed * self.max_workers))
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the executor metrics, keyed like the request metrics."""
+        return {
+            "executor": {
+                "workers": self.max_workers,
+                "running": self.running,
+                "waiting": self.waiting,
+                "rejected": self.rejected,
+                "utilisation": round(self.utilisation * 100, 1),
+            },
+            "executor.queue_wait": self.queue_wait.as_dict(),
+            "executor.run": self.run_time.as_dict(),
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the jobs that did not start yet and let the threads end."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _failed(job: Future) -> bool:
+    """Return True if a job raised or was cancelled."""
+    return job.cancelled() or job.exception() is not None
@@ -0,0 +1,170 @@
+"""Per-player lanes that order and throttle commands sent to the NAS."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Generic, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from .shared import LOGGER
+
+_T = TypeVar("_T")
+
+# Commands of one kind replacing each other while waiting in a command lane
+COMMAND_TRANSPORT = "transport"
+COMMAND_SHUFFLE = "shuffle"
+COMMAND_REPEAT = "repeat"
+COMMAND_VOLUME = "volume"
+
+
+class LatestValueLane(Generic[_T]):
+    """Send the latest submitted value, at most once per interval.
+
+    Values submitted while one is being sent replace each other, so stale
+    intermediate values are dropped and the last one is always sent last.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            name: str,
+            send: Callable[[_T], Awaitable[None]],
+            min_interval: float,
+    ) -> None:
+        """Initialize the lane."""
+        self._hass = hass
+        self._name = name
+        self._send = send
+        self._min_interval = min_interval
+
+        self._pending: _T | None = None
+        self._has_pending = False
+        self._last_sent = 0.0
+        self._sending = 0
+        self._task: asyncio.Task[None] | None = None
+
+        # Monotonic time the last send finished, a read started later reflects it
+        self.settled_at = 0.0
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a value waits to be sent or is being sent."""
+        return self._has_pending or self._sending > 0
+
+    @callback
+    def async_submit(self, value: _T) -> None:
+        """Queue a value, replacing any value that was not sent yet."""
+        self._pending = value
+        self._has_pending = True
+        if self._task is None:
+            self._task = self._hass.async_create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        """Send pending values until none are left."""
+        try:
+            while self._has_pending:
+                if (delay := self._last_sent + self._min_interval - monotonic()) > 0:
+                    await asyncio.sleep(delay)
+                    # The value may have been sent by async_send meanwhile
+                    continue
+                value = self._pending
+                self._pending = None
+                self._has_pending = False
+                try:
+                    await self._async_send(value)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception("Unable to send %s %s", self._name, value)
+        finally:
+            self._task = None
+
+    async def async_send(self, value: _T) -> None:
+        """Send a value now in place of the pending one, raising when sending fails."""
+        self._pending = None
+        self._has_pending = False
+        await self._async_send(value)
+
+    async def _async_send(self, value: _T) -> None:
+        """Send a value, recording when it was sent and when that finished."""
+        self._last_sent = monotonic()
+        self._sending += 1
+        try:
+            await self._send(value)
+        finally:
+            self._sending -= 1
+            self.settled_at = monotonic()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending value and stop sending."""
+        self._has_pending = False
+        self._pending = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+class CommandLane:
+    """Send the commands of one player one at a time, in the order they were submitted.
+
+    A command still waiting in the lane is dropped when a later command of the
+    same kind arrives, like a play followed by a pause, as sending both would
+    only cost a round trip and flash the earlier state. Commands without a
+    kind, like next track, are always sent.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize the lane."""
+        self._hass = hass
+        self._name = name
+        self._waiting: deque[tuple[str | None, Callable[[], Awaitable[object]], asyncio.Future[bool]]] = deque()
+        self._task: asyncio.Task[None] | None = None
+
+    async def async_run(self, kind: str | None, send: Callable[[], Awaitable[object]]) -> bool:
+        """Queue a command and wait for it to be sent.
+
+        Returns False when a later command superseded it before it was sent.
+        """
+        if kind is not None:
+            for waiting in [waiting for waiting in self._waiting if waiting[0] == kind]:
+                self._waiting.remove(waiting)
+                LOGGER.debug("Dropping %s %s command, superseded before it was sent", self._name, kind)
+                waiting[2].set_result(False)
+
+        future: asyncio.Future[bool] = self._hass.loop.create_future()
+        self._waiting.append((kind, send, future))
+        if self._task is None:
+            self._task = self._hass.async_create_task(self._async_run())
+        return await future
+
+    async def _async_run(self) -> None:
+        """Send waiting commands until none are left."""
+        try:
+            while self._waiting:
+                _, send, future = self._waiting.popleft()
+                if future.done():
+                    continue
+                try:
+                    await send()
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    if not future.done():
+                        future.set_exception(err)
+                else:
+                    if not future.done():
+                        future.set_result(True)
+        finally:
+            self._task = None
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the waiting commands and stop sending."""
+        while self._waiting:
+            self._waiting.popleft()[2].cancel()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
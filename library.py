@@ -0,0 +1,563 @@
+"""Local index of the Audio Station library."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import closing
+from datetime import timedelta
+from difflib import get_close_matches
+import json
+import re
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Any
+import unicodedata
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_start
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .api.SynoAudioStationClient import (
+    API_ALBUM,
+    API_ARTIST,
+    API_GENRE,
+    API_SONG,
+    SONG_ADDITIONAL,
+    SynoAudioStationClient,
+)
+from .const import DOMAIN
+from .executor import BlockingExecutor, ExecutorBusyError
+from .scheduler import RequestPriority, request_priority
+from .shared import LOGGER
+from .synology_dsm.exceptions import SynologyDSMException
+
+SYNC_PAGE_SIZE = 1000
+SYNC_INTERVAL = timedelta(hours=6)
+# Song pages re-read with their tags per sync, the list APIs tell nothing about retagged songs
+SYNC_VERIFY_PAGES = 25
+# Even when the library looks unchanged, refresh the whole index this often
+FULL_SYNC_MAX_AGE = timedelta(days=7)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS songs (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    artist TEXT,
+    album TEXT,
+    album_artist TEXT,
+    genre TEXT,
+    duration INTEGER,
+    track INTEGER,
+    disc INTEGER,
+    year INTEGER,
+    path TEXT,
+    synced INTEGER
+);
+CREATE INDEX IF NOT EXISTS songs_artist ON songs (artist COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS songs_album ON songs (album COLLATE NOCASE, album_artist COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS songs_genre ON songs (genre COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS albums (
+    name TEXT,
+    album_artist TEXT,
+    year INTEGER,
+    synced INTEGER,
+    PRIMARY KEY (name, album_artist)
+);
+CREATE TABLE IF NOT EXISTS artists (name TEXT PRIMARY KEY, synced INTEGER);
+CREATE TABLE IF NOT EXISTS genres (name TEXT PRIMARY KEY, synced INTEGER);
+CREATE VIRTUAL TABLE IF NOT EXISTS songs_fts USING fts5 (
+    title, artist, album_artist, album, genre,
+    content = 'songs', tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS songs_vocab USING fts5vocab (songs_fts, 'row');
+CREATE TRIGGER IF NOT EXISTS songs_fts_insert AFTER INSERT ON songs BEGIN
+    INSERT INTO songs_fts (rowid, title, artist, album_artist, album, genre)
+    VALUES (new.rowid, new.title, new.artist, new.album_artist, new.album, new.genre);
+END;
+CREATE TRIGGER IF NOT EXISTS songs_fts_delete AFTER DELETE ON songs BEGIN
+    INSERT INTO songs_fts (songs_fts, rowid, title, artist, album_artist, album, genre)
+    VALUES ('delete', old.rowid, old.title, old.artist, old.album_artist, old.album, old.genre);
+END;
+CREATE TRIGGER IF NOT EXISTS songs_fts_update AFTER UPDATE ON songs BEGIN
+    INSERT INTO songs_fts (songs_fts, rowid, title, artist, album_artist, album, genre)
+    VALUES ('delete', old.rowid, old.title, old.artist, old.album_artist, old.album, old.genre);
+    INSERT INTO songs_fts (rowid, title, artist, album_artist, album, genre)
+    VALUES (new.rowid, new.title, new.artist, new.album_artist, new.album, new.genre);
+END;
+"""
+
+# Matches in the title weigh most, bm25 ranks lower values first
+SEARCH_SQL = (
+    "SELECT songs.id, songs.title, songs.artist, songs.album, songs.album_artist, songs.genre,"
+    " songs.duration, bm25(songs_fts, 10.0, 5.0, 3.0, 4.0, 1.0) AS rank"
+    " FROM songs_fts JOIN songs ON songs.rowid = songs_fts.rowid"
+    " WHERE songs_fts MATCH ? ORDER BY rank LIMIT ?"
+)
+# Words not in the index also match the closest indexed words
+SEARCH_MAX_CORRECTIONS = 3
+SEARCH_MIN_SIMILARITY = 0.75
+SEARCH_MIN_CORRECTED_LENGTH = 3
+
+# What to fetch for each table: API, key of the items in the response and extra parameters
+SYNC_SOURCES: dict[str, tuple[str, str, dict[str, Any]]] = {
+    "songs": (API_SONG, "songs", {"additional": SONG_ADDITIONAL}),
+    "albums": (API_ALBUM, "albums", {}),
+    "artists": (API_ARTIST, "artists", {}),
+    "genres": (API_GENRE, "genres", {}),
+}
+
+UPSERTS = {
+    "songs": (
+        "INSERT INTO songs (id, title, artist, album, album_artist, genre, duration, track, disc, year, path, synced)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (id) DO UPDATE SET title = excluded.title, artist = excluded.artist,"
+        " album = excluded.album, album_artist = excluded.album_artist, genre = excluded.genre,"
+        " duration = excluded.duration, track = excluded.track, disc = excluded.disc,"
+        " year = excluded.year, path = excluded.path, synced = excluded.synced"
+    ),
+    "albums": (
+        "INSERT INTO albums (name, album_artist, year, synced) VALUES (?, ?, ?, ?)"
+        " ON CONFLICT (name, album_artist) DO UPDATE SET year = excluded.year, synced = excluded.synced"
+    ),
+    "artists": (
+        "INSERT INTO artists (name, synced) VALUES (?, ?)"
+        " ON CONFLICT (name) DO UPDATE SET synced = excluded.synced"
+    ),
+    "genres": (
+        "INSERT INTO genres (name, synced) VALUES (?, ?)"
+        " ON CONFLICT (name) DO UPDATE SET synced = excluded.synced"
+    ),
+}
+
+
+def _song_row(song: dict[str, Any], synced: int) -> tuple[Any, ...]:
+    """Convert a song of the Song API to a row of the songs table."""
+    additional = song.get("additional", {})
+    tag = additional.get("song_tag", {})
+    audio = additional.get("song_audio", {})
+    return (
+        song["id"],
+        song.get("title"),
+        tag.get("artist"),
+        tag.get("album"),
+        tag.get("album_artist"),
+        tag.get("genre"),
+        audio.get("duration"),
+        tag.get("track"),
+        tag.get("disc"),
+        tag.get("year"),
+        song.get("path"),
+        synced,
+    )
+
+
+def _search_words(query: str) -> list[str]:
+    """Split a query in words folded the way the search index folds them."""
+    folded = "".join(
+        char for char in unicodedata.normalize("NFKD", query.casefold()) if not unicodedata.combining(char)
+    )
+    return re.findall(r"\w+", folded)
+
+
+def _row(table: str, item: dict[str, Any], synced: int) -> tuple[Any, ...]:
+    """Convert an item of a library listing to a row of its table."""
+    if table == "songs":
+        return _song_row(item, synced)
+    if table == "albums":
+        return item.get("name", ""), item.get("album_artist", ""), item.get("year"), synced
+    return item.get("name", ""), synced
+
+
+class SynologyDSMLibraryIndex:
+    """Persistent SQLite index of the songs, albums, artists and genres of a NAS.
+
+    The first sync pages through the whole library and can resume where it
+    stopped after a restart, as does the full sync repeated every
+    FULL_SYNC_MAX_AGE. In between, syncs compare the library counts: albums,
+    artists or genres whose count changed are listed again, and a changed
+    song count lists the song ids without their tags, fetching only the
+    pages holding new songs. Every sync also re-reads a few song pages with
+    their tags in turn, which picks up retagged songs.
+    """
+
+    def __init__(
+            self, hass: HomeAssistant, client: SynoAudioStationClient, executor: BlockingExecutor, serial: str
+    ) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._client = client
+        self._executor = executor
+        self.path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.{serial}.library.db")
+
+        self._sync_lock = asyncio.Lock()
+        self._sync_task: asyncio.Task[None] | None = None
+        self._unsub: list[CALLBACK_TYPE] = []
+        # Connections are opened on several executor threads, only one creates the schema
+        self._schema_lock = Lock()
+        self._schema_ready = False
+        # Indexed words by first letter, loaded on the first search after a change.
+        # Searches and writes run on different executor threads.
+        self._vocabulary_lock = Lock()
+        self._vocabulary: dict[str, set[str]] | None = None
+        self.ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self._create_schema(conn)
+                    self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """Create the tables, and the search index of an index created before search existed."""
+        conn.executescript(SCHEMA)
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'search_index'").fetchone() is None:
+            with conn:
+                conn.execute("INSERT INTO songs_fts (songs_fts) VALUES ('rebuild')")
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('search_index', '1')")
+
+    def _get_meta(self) -> dict[str, Any]:
+        """Read the sync bookkeeping."""
+        with closing(self._connect()) as conn:
+            return {
+                row["key"]: json.loads(row["value"])
+                for row in conn.execute("SELECT key, value FROM meta")
+            }
+
+    def _set_meta(self, values: dict[str, Any]) -> None:
+        """Write sync bookkeeping."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in values.items()],
+            )
+
+    def _write_page(self, table: str, rows: list[tuple[Any, ...]], next_offset: int | None = None) -> None:
+        """Upsert one page, and remember how far a full sync got."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(UPSERTS[table], rows)
+            if next_offset is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (f"offset_{table}", json.dumps(next_offset)),
+                )
+        self._forget_vocabulary()
+
+    def _song_ids(self) -> set[str]:
+        """Return the ids of the indexed songs."""
+        with closing(self._connect()) as conn:
+            return {song_id for (song_id,) in conn.execute("SELECT id FROM songs")}
+
+    def _delete_songs(self, song_ids: set[str]) -> None:
+        """Drop songs that left the library."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM songs WHERE id = ?", [(song_id,) for song_id in song_ids])
+        self._forget_vocabulary()
+
+    def _drop_unseen(self, table: str, synced: int) -> None:
+        """Drop the rows of a table that were not seen while listing it again."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"DELETE FROM {table} WHERE synced < ?", (synced,))  # nosec
+        self._forget_vocabulary()
+
+    def _finish_sync(self, synced: int, fingerprint: dict[str, int]) -> None:
+        """Drop what was not seen during the sync and mark the index current."""
+        with closing(self._connect()) as conn, conn:
+            for table in SYNC_SOURCES:
+                conn.execute(f"DELETE FROM {table} WHERE synced < ?", (synced,))  # nosec
+            conn.execute("DELETE FROM meta WHERE key LIKE 'offset_%' OR key = 'sync_stamp'")
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("fingerprint", json.dumps(fingerprint)),
+                    ("last_full_sync", json.dumps(synced)),
+                ],
+            )
+        self._forget_vocabulary()
+
+    @callback
+    def async_start(self) -> None:
+        """Sync once Home Assistant has started, then periodically."""
+        self._unsub.append(async_at_start(self._hass, self._async_schedule_sync))
+        self._unsub.append(
+            async_track_time_interval(self._hass, self._async_schedule_sync, SYNC_INTERVAL)
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop syncing."""
+        while self._unsub:
+            self._unsub.pop()()
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+
+    @callback
+    def _async_schedule_sync(self, _now: Any = None) -> None:
+        """Start a sync in the background unless one is running."""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self.async_sync())
+
+    async def _async_fingerprint(self) -> dict[str, int]:
+        """Return the size of every part of the library, a cheap change detector."""
+        api_totals = await asyncio.gather(
+            *(self._client.library_list(api, 0, 1) for api, _, _ in SYNC_SOURCES.values())
+        )
+        return {table: data.get("total", 0) for table, data in zip(SYNC_SOURCES, api_totals)}
+
+    async def async_sync(self) -> None:
+        """Bring the index up to date with the NAS."""
+        async with self._sync_lock:
+            try:
+                with request_priority(RequestPriority.BULK):
+                    await self._async_sync()
+            except (ExecutorBusyError, SynologyDSMException) as err:
+                LOGGER.warning("Unable to sync the library index: %s", err)
+
+    async def _async_sync(self) -> None:
+        """Sync, the sync lock must be held."""
+        meta = await self._executor.async_run(self._get_meta)
+        self.ready = "last_full_sync" in meta
+
+        fingerprint = await self._async_fingerprint()
+        if (
+                not self.ready
+                or "sync_stamp" in meta
+                or time() - meta["last_full_sync"] >= FULL_SYNC_MAX_AGE.total_seconds()
+        ):
+            await self._async_full_sync(meta, fingerprint)
+            return
+
+        synced = int(time())
+        last_fingerprint = meta.get("fingerprint", {})
+        for table in SYNC_SOURCES:
+            if last_fingerprint.get(table) == fingerprint[table]:
+                continue
+            if table == "songs":
+                await self._async_sync_new_songs(fingerprint[table], synced)
+            else:
+                # Albums, artists and genres are small and listed without extra fields
+                await self._async_page_table(table, 0, fingerprint[table], synced, False)
+                await self._executor.async_run(self._drop_unseen, table, synced)
+
+        verify_offset = await self._async_verify_songs(meta.get("verify_offset", 0), fingerprint["songs"], synced)
+        await self._executor.async_run(
+            self._set_meta, {"fingerprint": fingerprint, "verify_offset": verify_offset}
+        )
+        LOGGER.debug("Library index of %s is current", self.path)
+
+    async def _async_full_sync(self, meta: dict[str, Any], fingerprint: dict[str, int]) -> None:
+        """Page through the whole library, resuming an interrupted full sync."""
+        # Resume an interrupted sync, as long as the library did not change meanwhile
+        if meta.get("sync_fingerprint") == fingerprint and "sync_stamp" in meta:
+            synced = meta["sync_stamp"]
+        else:
+            synced = int(time())
+            meta = {}
+            await self._executor.async_run(
+                self._set_meta,
+                {"sync_stamp": synced, "sync_fingerprint": fingerprint,
+                 **{f"offset_{table}": 0 for table in SYNC_SOURCES}},
+            )
+
+        for table in SYNC_SOURCES:
+            await self._async_page_table(table, meta.get(f"offset_{table}", 0), fingerprint[table], synced, True)
+
+        await self._executor.async_run(self._finish_sync, synced, fingerprint)
+        self.ready = True
+
+    async def _async_page_table(self, table: str, offset: int, total: int, synced: int, resumable: bool) -> None:
+        """Upsert the items of a table from offset on, recording the offset when the sync is resumable."""
+        api, key, params = SYNC_SOURCES[table]
+        while offset < total:
+            data = await self._client.library_list(api, offset, SYNC_PAGE_SIZE, **params)
+            items = data.get(key, [])
+            if not items:
+                break
+            offset += len(items)
+            rows = [_row(table, item, synced) for item in items]
+            await self._executor.async_run(self._write_page, table, rows, offset if resumable else None)
+        LOGGER.debug("Indexed %s %s of %s", offset, table, self.path)
+
+    async def _async_sync_new_songs(self, total: int, synced: int) -> None:
+        """Add the songs that joined the library and drop those that left.
+
+        Song ids are listed without tags, only pages holding unknown songs are
+        fetched again with them.
+        """
+        api, key, params = SYNC_SOURCES["songs"]
+        known = await self._executor.async_run(self._song_ids)
+        seen: set[str] = set()
+        fetched = 0
+        offset = 0
+        while offset < total:
+            data = await self._client.library_list(api, offset, SYNC_PAGE_SIZE)
+            if not (items := data.get(key, [])):
+                break
+            song_ids = {item["id"] for item in items}
+            seen.update(song_ids)
+            if not song_ids <= known:
+                data = await self._client.library_list(api, offset, SYNC_PAGE_SIZE, **params)
+                rows = [_song_row(song, synced) for song in data.get(key, [])]
+                await self._executor.async_run(self._write_page, "songs", rows)
+                fetched += 1
+            offset += len(items)
+
+        # A listing cut short says nothing about the songs after it
+        vanished = known - seen if offset >= total else set()
+        if vanished:
+            await self._executor.async_run(self._delete_songs, vanished)
+        LOGGER.debug("Fetched %s pages of new songs and dropped %s songs of %s", fetched, len(vanished), self.path)
+
+    async def _async_verify_songs(self, offset: int, total: int, synced: int) -> int:
+        """Re-read a few pages of songs with their tags, returning where the next sync goes on."""
+        api, key, params = SYNC_SOURCES["songs"]
+        if offset >= total:
+            offset = 0
+        for _ in range(SYNC_VERIFY_PAGES):
+            if offset >= total:
+                return 0
+            data = await self._client.library_list(api, offset, SYNC_PAGE_SIZE, **params)
+            if not (items := data.get(key, [])):
+                return 0
+            await self._executor.async_run(self._write_page, "songs", [_song_row(song, synced) for song in items])
+            offset += len(items)
+        return offset
+
+    def _query_page(self, key: str, sql: str, params: tuple[Any, ...], offset: int, limit: int) -> dict[str, Any]:
+        """Run a listing query, returning one page and the total like the list APIs of the NAS."""
+        with closing(self._connect()) as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM ({sql})", params).fetchone()[0]  # nosec
+            rows = conn.execute(f"{sql} LIMIT ? OFFSET ?", (*params, limit, offset))  # nosec
+            return {"total": total, key: [dict(row) for row in rows]}
+
+    async def async_list_artists(self, offset: int = 0, limit: int = 100) -> dict[str, Any]:
+        """Return a page of artists, sorted by name."""
+        return await self._executor.async_run(
+            self._query_page, "artists", "SELECT name FROM artists ORDER BY name COLLATE NOCASE", (), offset, limit
+        )
+
+    async def async_list_genres(self, offset: int = 0, limit: int = 100) -> dict[str, Any]:
+        """Return a page of genres, sorted by name."""
+        return await self._executor.async_run(
+            self._query_page, "genres", "SELECT name FROM genres ORDER BY name COLLATE NOCASE", (), offset, limit
+        )
+
+    async def async_list_albums(
+            self, *, artist: str | None = None, genre: str | None = None, offset: int = 0, limit: int = 100
+    ) -> dict[str, Any]:
+        """Return a page of albums, sorted by name.
+
+        Albums of an artist, including those it only appears on, are sorted by
+        year. Those are found through their songs, as are the albums of a genre.
+        """
+        if artist is None and genre is None:
+            return await self._executor.async_run(
+                self._query_page,
+                "albums",
+                "SELECT name, album_artist, year FROM albums ORDER BY name COLLATE NOCASE",
+                (),
+                offset,
+                limit,
+            )
+        if artist is not None:
+            where, params, order = (
+                "artist = ? COLLATE NOCASE OR album_artist = ? COLLATE NOCASE", (artist, artist), "year, "
+            )
+        else:
+            where, params, order = "genre = ? COLLATE NOCASE", (genre,), ""
+        return await self._executor.async_run(
+            self._query_page,
+            "albums",
+            "SELECT album AS name, album_artist, MIN(year) AS year FROM songs"
+            f" WHERE {where} GROUP BY album, album_artist"  # nosec
+            f" ORDER BY {order}album COLLATE NOCASE",
+            params,
+            offset,
+            limit,
+        )
+
+    async def async_list_songs(
+            self,
+            *,
+            title: str | None = None,
+            artist: str | None = None,
+            album: str | None = None,
+            album_artist: str | None = None,
+            genre: str | None = None,
+            offset: int = 0,
+            limit: int = 100,
+    ) -> dict[str, Any]:
+        """Return a page of songs matching all given fields exactly (case insensitive)."""
+        filters = {
+            "title": title,
+            "artist": artist,
+            "album": album,
+            "album_artist": album_artist,
+            "genre": genre,
+        }
+        filters = {column: value for column, value in filters.items() if value is not None}
+        where = " AND ".join(f"{column} = ? COLLATE NOCASE" for column in filters)
+        return await self._executor.async_run(
+            self._query_page,
+            "songs",
+            f"SELECT * FROM songs {'WHERE ' + where if where else ''}"  # nosec
+            " ORDER BY album COLLATE NOCASE, disc, track, title COLLATE NOCASE",
+            tuple(filters.values()),
+            offset,
+            limit,
+        )
+
+    def _load_vocabulary(self, conn: sqlite3.Connection) -> dict[str, set[str]]:
+        """Return the indexed words grouped by first letter."""
+        with self._vocabulary_lock:
+            if (vocabulary := self._vocabulary) is None:
+                vocabulary = {}
+                for (term,) in conn.execute("SELECT term FROM songs_vocab"):
+                    vocabulary.setdefault(term[0], set()).add(term)
+                self._vocabulary = vocabulary
+            return vocabulary
+
+    def _forget_vocabulary(self) -> None:
+        """Drop the loaded words after a write, the next search loads them again."""
+        with self._vocabulary_lock:
+            self._vocabulary = None
+
+    def _match_word(self, vocabulary: dict[str, set[str]], word: str) -> str:
+        """Build the match expression of a query word, adding corrections for typos."""
+        terms = [f'"{word}"*']
+        candidates = vocabulary.get(word[0], set())
+        if len(word) >= SEARCH_MIN_CORRECTED_LENGTH and word not in candidates:
+            similar_length = [term for term in candidates if abs(len(term) - len(word)) <= 2]
+            terms.extend(
+                f'"{term}"'
+                for term in get_close_matches(word, similar_length, SEARCH_MAX_CORRECTIONS, SEARCH_MIN_SIMILARITY)
+            )
+        return f"({' OR '.join(terms)})"
+
+    def _search(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """Rank songs matching all words of the query, or any word when none match all."""
+        if not (words := _search_words(query)):
+            return []
+        with closing(self._connect()) as conn:
+            vocabulary = self._load_vocabulary(conn)
+            matches = [self._match_word(vocabulary, word) for word in words]
+            rows = conn.execute(SEARCH_SQL, (" AND ".join(matches), limit)).fetchall()
+            if not rows and len(matches) > 1:
+                rows = conn.execute(SEARCH_SQL, (" OR ".join(matches), limit)).fetchall()
+        return [{**dict(row), "rank": round(-row["rank"], 3)} for row in rows]
+
+    async def async_search(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the songs best matching a free text query over title, artists, album and genre.
+
+        Prefixes match, and words that are not in the library also match the
+        closest words that are, so small typos still find the song.
+        """
+        return await self._executor.async_run(self._search, query, limit)
@@ -1,30 +1,44 @@
-from functools import wraps
-from typing import Optional
-
-from homeassistant.components.media_player import MediaPlayerEntity
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial, wraps
+from math import inf
+from time import monotonic
+from typing import Any, Optional
+
+from homeassistant.components.media_player import BrowseMedia, MediaPlayerEntity
 from homeassistant.components.media_player.const import (
+    MediaClass,
     SUPPORT_VOLUME_MUTE,
     SUPPORT_VOLUME_SET,
     SUPPORT_STOP,
     SUPPORT_PLAY,
-    SUPPORT_PAUSE, MEDIA_TYPE_MUSIC, REPEAT_MODES, REPEAT_MODE_ALL, REPEAT_MODE_ONE,
+    SUPPORT_PAUSE, MEDIA_TYPE_MUSIC, REPEAT_MODES, REPEAT_MODE_ALL, REPEAT_MODE_ONE, REPEAT_MODE_OFF,
     SUPPORT_CLEAR_PLAYLIST, SUPPORT_SHUFFLE_SET, SUPPORT_REPEAT_SET, SUPPORT_PREVIOUS_TRACK, SUPPORT_NEXT_TRACK,
+    SUPPORT_BROWSE_MEDIA, SUPPORT_PLAY_MEDIA, MediaType,
 )
+from homeassistant.components.media_player.errors import BrowseError
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_PLAYING, STATE_IDLE, STATE_PAUSED
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.dt import utcnow
 
 from .shared import LOGGER
-from .synology_dsm.exceptions import SynologyDSMAPIErrorException
-
-from .api.SynoApi import SynoApi
-from .synology_dsm.api.dsm.information import SynoDSMInformation
-from .synology_dsm.api.audio_station import RemotePlayerAction, RepeatMode, SynoAudioStation, Player, \
-    RemotePlayerStatus
+from .synology_dsm.exceptions import SynologyDSMAPIErrorException, SynologyDSMException
+
+from .api.SynoApi import SynoApi, signal_new_players
+from .coordinator import SynologyDSMRemotePlayerUpdateCoordinator
+from .entity import SynologyDSMRemotePlayerEntity
+from .lanes import COMMAND_REPEAT, COMMAND_SHUFFLE, COMMAND_TRANSPORT
+from .scheduler import RequestPriority, request_priority
+from .browse_media import parse_album_value, parse_content_id
+from .cover_art import cover_key
+from .synology_dsm.api.audio_station import RemotePlayerAction, RemotePlayerStatus, RepeatMode, Player, SongSortMode
 from .synology_dsm.api.audio_station.models.playlist_status import PlaylistStatus
+from .synology_dsm.api.audio_station.models.queue_mode import QueueMode
 from .const import DOMAIN, SYNO_API
 
 SUPPORT_DLNA_PLAYER = (
@@ -32,8 +46,18 @@ SUPPORT_DLNA_PLAYER = (
         | SUPPORT_STOP | SUPPORT_PLAY | SUPPORT_PAUSE
         | SUPPORT_CLEAR_PLAYLIST | SUPPORT_SHUFFLE_SET | SUPPORT_REPEAT_SET
         | SUPPORT_NEXT_TRACK | SUPPORT_PREVIOUS_TRACK
+        | SUPPORT_BROWSE_MEDIA | SUPPORT_PLAY_MEDIA
 )
 
+# Queued songs around the current one shown as attribute
+QUEUE_WINDOW_BEFORE = 2
+QUEUE_WINDOW_AFTER = 2
+# A window that failed to load is fetched again once the queue changed, or after this
+QUEUE_WINDOW_RETRY = 60  # sec
+
+# Polled positions this close to the extrapolated one are not a seek
+POSITION_TOLERANCE = 2  # sec
+
 PLAY_STATE_TO_STATE = {
     PlaylistStatus.transitioning: STATE_PLAYING,
     PlaylistStatus.playing: STATE_PLAYING,
@@ -42,6 +66,69 @@ PLAY_STATE_TO_STATE = {
     PlaylistStatus.none: STATE_IDLE,
 }
 
+REPEAT_MODE_TO_STATE = {
+    RepeatMode.all: REPEAT_MODE_ALL,
+    RepeatMode.one: REPEAT_MODE_ONE,
+    RepeatMode.none: REPEAT_MODE_OFF,
+}
+
+
+def _repeat_state(repeat: Any) -> str:
+    """Return the repeat mode of Home Assistant for the one of Audio Station."""
+    try:
+        return REPEAT_MODE_TO_STATE[RepeatMode(repeat)]
+    except (KeyError, ValueError):
+        return REPEAT_MODE_OFF
+
+
+# Attributes commands set optimistically, read from a polled status
+POLLED_VALUES: dict[str, Callable[[RemotePlayerStatus], Any]] = {
+    "state": lambda status: PLAY_STATE_TO_STATE[status.state],
+    "volume_level": lambda status: status.volume / 100,
+    "shuffle": lambda status: status.play_mode.play_mode_shuffle,
+    "repeat": lambda status: _repeat_state(status.play_mode.play_mode_repeat),
+}
+
+
+class PlayerSnapshot:
+    """What a player entity shows, compared between polls to skip writing an unchanged state.
+
+    Holds the position sample instead of the polled position, the sample only
+    changes when extrapolating from the previous one stopped being accurate.
+    """
+
+    __slots__ = (
+        "available",
+        "attributes",
+        "state",
+        "volume_level",
+        "shuffle",
+        "repeat",
+        "media_content_id",
+        "media_title",
+        "media_artist",
+        "media_album_name",
+        "media_image_hash",
+        "media_duration",
+        "media_position",
+        "media_position_updated_at",
+    )
+
+    def __init__(self, entity: "SynologyDlnaMediaPlayer") -> None:
+        """Take a snapshot of an entity."""
+        self.available = entity.available
+        self.attributes = entity.extra_state_attributes
+        for name in self.__slots__[2:]:
+            setattr(self, name, getattr(entity, name) if self.available else None)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both snapshots show the same."""
+        if not isinstance(other, PlayerSnapshot):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
 
 def log_command_error(command: str):
     """Return decorator that logs command failure."""
@@ -69,23 +156,158 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][config_entry.entry_id]
     api: SynoApi = data[SYNO_API]
 
-    players = await hass.async_add_executor_job(api.dsm.audio_station.remote_player_get_players)
+    coordinator = api.remote_player_coordinator
+    added: set[str] = set()
+
+    @callback
+    def async_add_players(players: list[Player]) -> None:
+        """Add entities for players that do not have one yet."""
+        devices = [
+            SynologyDlnaMediaPlayer(api, coordinator, player) for player in players if player.id not in added
+        ]
+        added.update(device.unique_id for device in devices)
+        async_add_entities(devices)
 
-    devices = [SynologyDlnaMediaPlayer(hass, api.information, api.dsm.audio_station, player) for player in players]
-    async_add_entities(devices, True)
+    async_add_players(api.players)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, signal_new_players(config_entry), async_add_players)
+    )
 
 
 # noinspection PyAbstractClass
-class SynologyDlnaMediaPlayer(MediaPlayerEntity):
+class SynologyDlnaMediaPlayer(SynologyDSMRemotePlayerEntity, MediaPlayerEntity):
     """SynologyDlnaMediaPlayer. """
 
-    def __init__(self, hass: HomeAssistant, info: SynoDSMInformation, audio_station: SynoAudioStation, player: Player):
+    def __init__(self, api: SynoApi, coordinator: SynologyDSMRemotePlayerUpdateCoordinator, player: Player):
         """Initialize the media player."""
-        self._hass = hass
-        self._api = audio_station
-        self._info = info
-        self._player = player
-        self._status: Optional[RemotePlayerStatus] = None
+        super().__init__(api, coordinator, player)
+        self._audio_station = api.audio_station
+
+        # Values set by accepted commands, shown until a later read reconciles them
+        self._optimistic: dict[str, Any] = {}
+        self._optimistic_since = 0.0
+
+        # Shared with the services, so commands from both are sent in order
+        self._command_lane = api.command_lane(player.id)
+        self._volume_lane = api.volume_lane(player.id)
+
+        # Last position sample, kept while extrapolating from it stays accurate
+        self._position: float | None = None
+        self._position_updated_at: datetime | None = None
+        self._position_playing = False
+        self._position_song_id: str | None = None
+
+        # What the state written last showed
+        self._snapshot: PlayerSnapshot | None = None
+        self._queue_window_task: asyncio.Task[None] | None = None
+        # Queue version and window of the last failed fetch, and when it failed
+        self._queue_window_failed: tuple[int, int, int] | None = None
+        self._queue_window_failed_at = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Take the first position sample, the queue window fetch stops with the entity."""
+        self.async_on_remove(self._async_cancel_queue_window)
+        self._update_position()
+        await super().async_added_to_hass()
+
+    @callback
+    def _update_position(self) -> None:
+        """Take a new position sample on pause, seek or track change.
+
+        While the polled position matches the one extrapolated from the last
+        sample, the sample is kept so the state does not change every poll.
+        """
+        if (status := self._status) is None:
+            return
+
+        now = utcnow()
+        position = status.position / 1000
+        playing = status.state == PlaylistStatus.playing
+        song_id = status.song.id if status.song else None
+
+        if self._position_updated_at is not None and song_id == self._position_song_id:
+            if playing and self._position_playing:
+                expected = self._position + (now - self._position_updated_at).total_seconds()
+                if abs(expected - position) <= POSITION_TOLERANCE:
+                    return
+            elif not playing and not self._position_playing and position == self._position:
+                return
+
+        self._position = position
+        self._position_updated_at = now
+        self._position_playing = playing
+        self._position_song_id = song_id
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Flag a status restored from the last run, and show the songs around the current one."""
+        attributes: dict[str, Any] = {"stale": self._player.id in self.coordinator.stale}
+        if (window := self._queue_window()) is not None:
+            attributes["queue_position"] = self._status.index
+            attributes["queue_size"] = self._status.playlist_total
+            attributes["queue_window"] = window
+        return attributes
+
+    def _queue_window_range(self) -> tuple[int, int] | None:
+        """Return the offset and length of the queue window, None without a queue."""
+        if self._status is None or not self._status.playlist_total:
+            return None
+        offset = max(self._status.index - QUEUE_WINDOW_BEFORE, 0)
+        return offset, self._status.index + QUEUE_WINDOW_AFTER + 1 - offset
+
+    def _queue_window(self) -> list[dict[str, Any]] | None:
+        """Return the songs around the current one if they were fetched already."""
+        if (window := self._queue_window_range()) is None:
+            return None
+        return self._api.queue_cache.get_cached(self._player.id, self._status.playlist_timestamp, *window)
+
+    @callback
+    def _async_load_queue_window(self) -> None:
+        """Fetch the songs around the current one in the background when the queue changed."""
+        if (
+                self._queue_window_task is not None
+                or not self._api.initialized
+                or not self._api.supervisor.available
+                or (window := self._queue_window_range()) is None
+                or self._queue_window() is not None
+        ):
+            return
+        key = (self._status.playlist_timestamp, *window)
+        if key == self._queue_window_failed and monotonic() - self._queue_window_failed_at < QUEUE_WINDOW_RETRY:
+            return
+        self._queue_window_task = self.hass.async_create_task(self._async_fetch_queue_window(*key))
+
+    async def _async_fetch_queue_window(self, version: int, offset: int, limit: int) -> None:
+        """Fetch the pages of the queue window and show them."""
+        try:
+            with request_priority(RequestPriority.POLL):
+                await self._api.queue_cache.async_get(self._player.id, version, offset, limit)
+        except SynologyDSMException as err:
+            LOGGER.debug("Unable to fetch the queue of player %s: %s", self._player.id, err)
+            # Not again on every poll
+            self._queue_window_failed = (version, offset, limit)
+            self._queue_window_failed_at = monotonic()
+            return
+        finally:
+            self._queue_window_task = None
+        self._queue_window_failed = None
+        self._async_write_if_changed()
+
+    @callback
+    def _async_cancel_queue_window(self) -> None:
+        """Stop fetching the queue window."""
+        if self._queue_window_task is not None:
+            self._queue_window_task.cancel()
+            self._queue_window_task = None
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write the state unless it shows the same as the one written last."""
+        snapshot = PlayerSnapshot(self)
+        if snapshot == self._snapshot:
+            return
+        self._snapshot = snapshot
+        self.async_write_ha_state()
 
     @property
     def name(self):
@@ -97,119 +319,217 @@ class SynologyDlnaMediaPlayer(MediaPlayerEntity):
         """Flag media player features that are supported."""
         return SUPPORT_DLNA_PLAYER
 
-    @property
-    def should_poll(self) -> bool:
-        """Polling needed for this device."""
-        return True
-
-    async def async_update(self):
-        """Update player info."""
-        self._status = await self._hass.async_add_executor_job(self._api.remote_player_get_player_status,
-                                                               self._player.id)
-
-    @property
-    def available(self) -> bool:
-        """Return True if the device is available."""
-        return self._player is not None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Get attributes about the device."""
-        info = self._player
-        return DeviceInfo(
-            identifiers={(DOMAIN, info.id)},
-            name=info.name,
-            via_device=(DOMAIN, self._info.serial),
-        )
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return str(self._player.id)
+    @callback
+    def _async_set_optimistic(self, **values: Any) -> None:
+        """Show the expected outcome of an accepted command until a read confirms it."""
+        self._optimistic.update(values)
+        self._optimistic_since = monotonic()
+        self._snapshot = PlayerSnapshot(self)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_request_confirmation(self) -> None:
+        """Read the status back shortly, coalesced with other recent commands."""
+        self.coordinator.async_request_confirmation(self._player.id)
+
+    def _actual_values(self) -> dict[str, Any]:
+        """Return the polled values of the attributes commands set optimistically, empty without a status."""
+        if self._status is None:
+            return {}
+        return {key: polled(self._status) for key, polled in POLLED_VALUES.items()}
+
+    def _shown_value(self, key: str) -> Any:
+        """Return the optimistic value of an attribute, or else its polled value.
+
+        None while the player has no status, like after it vanished.
+        """
+        if self._status is None:
+            return None
+        if key in self._optimistic:
+            return self._optimistic[key]
+        return POLLED_VALUES[key](self._status)
+
+    def _optimistic_settled(self) -> float:
+        """Return since when a read reflects the optimistic values.
+
+        A volume waits in its lane up to VOLUME_MIN_INTERVAL, reads before it
+        was sent still show the previous one.
+        """
+        if "volume_level" not in self._optimistic:
+            return self._optimistic_since
+        if self._volume_lane.busy:
+            return inf
+        return max(self._optimistic_since, self._volume_lane.settled_at)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reconcile optimistic values with a status fetched after the command."""
+        if self._optimistic and self.coordinator.poll_started.get(self._player.id, 0) >= self._optimistic_settled():
+            if self._status is not None:
+                actual = self._actual_values()
+                rejected = {key: value for key, value in self._optimistic.items() if actual.get(key) != value}
+                if rejected:
+                    LOGGER.debug("Player %s did not apply %s, rolling back", self._player.id, rejected)
+            self._optimistic.clear()
+        self._update_position()
+        self._async_load_queue_window()
+        # Every poll notifies all players of the NAS, most of them did not change
+        self._async_write_if_changed()
 
     @log_command_error("move to previous track")
     async def async_media_previous_track(self):
         """Send previous track command."""
-        await self._hass.async_add_executor_job(self._api.remote_player_control, self._player.id,
-                                                RemotePlayerAction.prev)
-        await self.async_update()
+        await self._command_lane.async_run(
+            None, partial(self._audio_station.remote_player_control, self._player.id, RemotePlayerAction.prev)
+        )
+        self._async_request_confirmation()
 
     @log_command_error("move to next track")
     async def async_media_next_track(self):
         """Send next track command."""
-        await self._hass.async_add_executor_job(self._api.remote_player_control, self._player.id,
-                                                RemotePlayerAction.next)
-        await self.async_update()
+        await self._command_lane.async_run(
+            None, partial(self._audio_station.remote_player_control, self._player.id, RemotePlayerAction.next)
+        )
+        self._async_request_confirmation()
 
     @log_command_error("stop")
     async def async_media_stop(self):
         """Send stop command."""
-        await self._hass.async_add_executor_job(self._api.remote_player_control, self._player.id,
-                                                RemotePlayerAction.stop)
-        await self.async_update()
+        if await self._command_lane.async_run(
+                COMMAND_TRANSPORT,
+                partial(self._audio_station.remote_player_control, self._player.id, RemotePlayerAction.stop),
+        ):
+            self._async_set_optimistic(state=STATE_IDLE)
+            self._async_request_confirmation()
 
     @log_command_error("pause")
     async def async_media_pause(self):
         """Send pause command."""
-        await self._hass.async_add_executor_job(self._api.remote_player_control, self._player.id,
-                                                RemotePlayerAction.pause)
-        await self.async_update()
+        if await self._command_lane.async_run(
+                COMMAND_TRANSPORT,
+                partial(self._audio_station.remote_player_control, self._player.id, RemotePlayerAction.pause),
+        ):
+            self._async_set_optimistic(state=STATE_PAUSED)
+            self._async_request_confirmation()
 
     @log_command_error("play")
     async def async_media_play(self):
         """Send play command."""
-        await self._hass.async_add_executor_job(self._api.remote_player_control, self._player.id,
-                                                RemotePlayerAction.play)
-        await self.async_update()
+        if await self._command_lane.async_run(
+                COMMAND_TRANSPORT,
+                partial(self._audio_station.remote_player_control, self._player.id, RemotePlayerAction.play),
+        ):
+            self._async_set_optimistic(state=STATE_PLAYING)
+            self._async_request_confirmation()
 
     @log_command_error("clear playlist")
     async def async_clear_playlist(self):
         """Clear players playlist."""
-        await self._hass.async_add_executor_job(self._api.remote_player_clear_playlist, self._player.id)
-        await self.async_update()
+        await self._command_lane.async_run(
+            None, partial(self._audio_station.remote_player_clear_playlist, self._player.id)
+        )
+        self._async_request_confirmation()
 
     @log_command_error("set shuffle")
     async def async_set_shuffle(self, shuffle: bool):
         """Enable/disable shuffle mode."""
-        await self._hass.async_add_executor_job(self._api.remote_player_shuffle, self._player.id, shuffle)
-        await self.async_update()
+        if await self._command_lane.async_run(
+                COMMAND_SHUFFLE, partial(self._audio_station.remote_player_shuffle, self._player.id, shuffle)
+        ):
+            self._async_set_optimistic(shuffle=shuffle)
+            self._async_request_confirmation()
 
     @log_command_error("set repeat")
     async def async_set_repeat(self, repeat: REPEAT_MODES):
         """Enable/disable shuffle mode."""
         if repeat == REPEAT_MODE_ALL:
-            await self._hass.async_add_executor_job(self._api.remote_player_repeat, self._player.id, RepeatMode.all)
+            mode = RepeatMode.all
         elif repeat == REPEAT_MODE_ONE:
-            await self._hass.async_add_executor_job(self._api.remote_player_repeat, self._player.id, RepeatMode.one)
+            mode = RepeatMode.one
         else:
-            await self._hass.async_add_executor_job(self._api.remote_player_repeat, self._player.id, RepeatMode.none)
-        await self.async_update()
+            mode = RepeatMode.none
+        if await self._command_lane.async_run(
+                COMMAND_REPEAT, partial(self._audio_station.remote_player_repeat, self._player.id, mode)
+        ):
+            self._async_set_optimistic(repeat=REPEAT_MODE_TO_STATE[mode])
+            self._async_request_confirmation()
 
-    @log_command_error("set volume level")
     async def async_set_volume_level(self, volume):
         """Set volume level, range 0..1."""
-        await self._hass.async_add_executor_job(self._api.remote_player_volume, self._player.id, int(volume * 100))
-        await self.async_update()
+        self._volume_lane.async_submit(int(volume * 100))
+        self._async_set_optimistic(volume_level=int(volume * 100) / 100)
+
+    async def async_browse_media(
+            self, media_content_type: str | None = None, media_content_id: str | None = None
+    ) -> BrowseMedia:
+        """Browse the library of the NAS one page at a time."""
+        media = await self._api.media_browser.async_browse(media_content_type, media_content_id)
+        for child in media.children or []:
+            if child.media_class == MediaClass.ALBUM:
+                child.thumbnail = self.get_browse_image_url(child.media_content_type, child.media_content_id)
+        return media
+
+    async def async_get_browse_image(
+            self, media_content_type: str, media_content_id: str, media_image_id: str | None = None
+    ) -> tuple[bytes | None, str | None]:
+        """Serve the cover thumbnail of a browsed album."""
+        if media_content_type != MediaType.ALBUM:
+            return None, None
+        value, _ = parse_content_id(media_content_id)
+        return await self._api.cover_art.async_get(*parse_album_value(value))
+
+    @log_command_error("play media")
+    async def async_play_media(self, media_type: str, media_id: str, **kwargs: Any) -> None:
+        """Replace the queue with a browsed song, album or artist and play it."""
+        value, _ = parse_content_id(media_id)
+        if media_type in (MediaType.TRACK, MediaType.MUSIC):
+            send = partial(
+                self._audio_station.remote_player_play_songs, self._player.id, value, QueueMode.replace, True
+            )
+        elif media_type == MediaType.ALBUM:
+            name, album_artist = parse_album_value(value)
+            send = partial(
+                self._audio_station.remote_player_play_album,
+                self._player.id, name, album_artist, SongSortMode.track, QueueMode.replace, True,
+            )
+        elif media_type == MediaType.ARTIST:
+            send = partial(
+                self._audio_station.remote_player_play_artist,
+                self._player.id, value, SongSortMode.album, QueueMode.replace, True,
+            )
+        else:
+            raise BrowseError(f"Unable to play {media_type} {media_id}")
+        # Ordered with the transport commands, a pause right after still applies to the new queue
+        await self._command_lane.async_run(None, send)
+        self._async_set_optimistic(state=STATE_PLAYING)
+        self._async_request_confirmation()
+
+    @property
+    def _song(self) -> Any:
+        """Return the current song, None without a status or a song."""
+        if self._status is None:
+            return None
+        return self._status.song
 
     @property
     def media_album_name(self) -> Optional[str]:
         """Album name of current playing media, music track only."""
-        if self._status.song:
-            return self._status.song.additional.song_tag.album
+        if self._song:
+            return self._song.additional.song_tag.album
         return None
 
     @property
     def media_artist(self) -> Optional[str]:
         """Artist of current playing media, music track only."""
-        if self._status.song:
-            return self._status.song.additional.song_tag.artist
+        if self._song:
+            return self._song.additional.song_tag.artist
         return None
 
     @property
     def media_content_id(self) -> Optional[str]:
         """Content ID of current playing media."""
-        if self._status.song:
-            return self._status.song.id
+        if self._song:
+            return self._song.id
         return None
 
     @property
@@ -220,8 +540,8 @@ class SynologyDlnaMediaPlayer(MediaPlayerEntity):
     @property
     def media_duration(self):
         """Duration of current playing media in seconds."""
-        if self._status.song:
-            duration = self._status.song.additional.song_audio.duration
+        if self._song:
+            duration = self._song.additional.song_audio.duration
             if isinstance(duration, int):
                 return duration / 1000
         return None
@@ -229,41 +549,60 @@ class SynologyDlnaMediaPlayer(MediaPlayerEntity):
     @property
     def media_position(self):
         """Position of current playing media in seconds."""
+        if self._position is not None:
+            return self._position
+        if self._status is None:
+            return None
         return self._status.position / 1000
 
+    @property
+    def media_position_updated_at(self) -> datetime | None:
+        """When the position was sampled, the frontend extrapolates from it while playing."""
+        return self._position_updated_at
+
     @property
     def media_image_remotely_accessible(self) -> bool:
-        """If the image url is remotely accessible."""
-        return True
+        """Covers are served by hass from its cache, the NAS needs a session."""
+        return False
+
+    @property
+    def media_image_hash(self) -> str | None:
+        """Hash of the album cover, only changes when the album does."""
+        if self._song:
+            song_tag = self._song.additional.song_tag
+            return cover_key(song_tag.album, song_tag.album_artist)[:16]
+        return None
 
-    # @property
-    # def media_image(self) -> bytearray:
-    #     """Image url of current playing media."""
-    #     # return self._player.
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Fetch the cover of the current album through the on-disk cache."""
+        if not self._song:
+            return None, None
+        song_tag = self._song.additional.song_tag
+        return await self._api.cover_art.async_get(song_tag.album, song_tag.album_artist)
 
     @property
     def media_title(self) -> Optional[str]:
         """Title of current playing media."""
-        if self._status.song:
-            return self._status.song.title
+        if self._song:
+            return self._song.title
         return None
 
     @property
-    def shuffle(self) -> bool:
+    def shuffle(self) -> bool | None:
         """Boolean if shuffle is enabled."""
-        return self._status.play_mode.play_mode_shuffle
+        return self._shown_value("shuffle")
 
     @property
-    def repeat(self) -> str:
-        """Boolean if repeat is enabled."""
-        return self._status.play_mode.play_mode_repeat
+    def repeat(self) -> str | None:
+        """Repeat mode of the player."""
+        return self._shown_value("repeat")
 
     @property
-    def state(self) -> str:
+    def state(self) -> str | None:
         """State of the player."""
-        return PLAY_STATE_TO_STATE[self._status.state]
+        return self._shown_value("state")
 
     @property
-    def volume_level(self) -> float:
+    def volume_level(self) -> float | None:
         """Volume level of the media player (0..1)."""
-        return self._status.volume / 100
+        return self._shown_value("volume_level")
@@ -0,0 +1,113 @@
+"""Latency and error metrics of the requests sent to a NAS."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from time import monotonic
+from typing import Any
+
+# Upper bounds of the latency buckets in milliseconds, the last one catches the rest
+LATENCY_BUCKETS = (
+    5, 10, 20, 35, 50, 75, 100, 150, 250, 400, 600, 1000, 1500, 2500, 4000, 6000, 10000, 15000, 30000, float("inf")
+)
+# Percentiles cover the current and the previous window, so they follow a degrading NAS
+METRICS_WINDOW = 600  # sec
+
+
+class LatencyHistogram:
+    """Latency distribution of one window, in fixed memory."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0
+
+    def record(self, milliseconds: float) -> None:
+        """Count one request."""
+        self.counts[bisect_left(LATENCY_BUCKETS, milliseconds)] += 1
+        self.total += 1
+
+
+def percentile(histograms: list[LatencyHistogram], quantile: float, maximum: float) -> float | None:
+    """Estimate a latency percentile, interpolating inside the bucket it falls in.
+
+    The estimate never exceeds the slowest request seen.
+    """
+    total = sum(histogram.total for histogram in histograms)
+    if not total:
+        return None
+
+    rank = quantile * total
+    seen = 0
+    for index, upper in enumerate(LATENCY_BUCKETS):
+        count = sum(histogram.counts[index] for histogram in histograms)
+        if count and seen + count >= rank:
+            lower = LATENCY_BUCKETS[index - 1] if index else 0
+            if upper == float("inf"):
+                return round(min(float(lower), maximum), 1)
+            return round(min(lower + (upper - lower) * (rank - seen) / count, maximum), 1)
+        seen += count
+    return None
+
+
+class MethodMetrics:
+    """Call and error counts and recent latencies of one API method."""
+
+    __slots__ = ("calls", "errors", "max_ms", "_current", "_previous", "_window_started")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.calls = 0
+        self.errors = 0
+        self.max_ms = 0.0
+        self._current = LatencyHistogram()
+        self._previous = LatencyHistogram()
+        self._window_started = monotonic()
+
+    def record(self, seconds: float, error: bool) -> None:
+        """Count one request."""
+        if (now := monotonic()) - self._window_started >= METRICS_WINDOW:
+            self._previous, self._current = self._current, LatencyHistogram()
+            self._window_started = now
+
+        milliseconds = seconds * 1000
+        self.calls += 1
+        self.errors += error
+        self.max_ms = max(self.max_ms, milliseconds)
+        self._current.record(milliseconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics."""
+        recent = [self._previous, self._current]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "p50_ms": percentile(recent, 0.50, self.max_ms),
+            "p95_ms": percentile(recent, 0.95, self.max_ms),
+            "p99_ms": percentile(recent, 0.99, self.max_ms),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class RequestMetrics:
+    """Metrics of every API method called on a NAS."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._methods: dict[str, MethodMetrics] = {}
+
+    def record(self, method: str, seconds: float, error: bool) -> None:
+        """Count one request of an API method, like SYNO.AudioStation.RemotePlayer.getstatus."""
+        if (metrics := self._methods.get(method)) is None:
+            metrics = self._methods[method] = MethodMetrics()
+        metrics.record(seconds, error)
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests of all methods."""
+        return sum(metrics.errors for metrics in self._methods.values())
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of every method."""
+        return {method: metrics.as_dict() for method, metrics in sorted(self._methods.items())}
@@ -0,0 +1,120 @@
+"""Pages of the play queues of remote players, fetched when someone looks at them."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api.SynoAudioStationClient import SynoAudioStationClient
+
+QUEUE_PAGE_SIZE = 50
+# Pages kept per player, the ones around the current song are looked at most
+QUEUE_MAX_PAGES = 4
+
+
+def _queue_song(position: int, song: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a queued song worth showing."""
+    additional = song.get("additional") or {}
+    song_tag = additional.get("song_tag") or {}
+    song_audio = additional.get("song_audio") or {}
+    return {
+        "position": position,
+        "id": song.get("id"),
+        "title": song.get("title"),
+        "artist": song_tag.get("artist"),
+        "album": song_tag.get("album"),
+        "duration": song_audio.get("duration"),
+    }
+
+
+class _PlayerQueue:
+    """Cached pages of one version of a queue."""
+
+    __slots__ = ("version", "total", "pages")
+
+    def __init__(self, version: int) -> None:
+        """Initialize an empty queue."""
+        self.version = version
+        self.total: int | None = None
+        # Songs by page offset, least recently used first
+        self.pages: OrderedDict[int, list[dict[str, Any]]] = OrderedDict()
+
+
+class SynologyDSMQueueCache:
+    """Play queues of the remote players of a NAS, one page at a time.
+
+    Pages are kept until the playlist timestamp of the player changes, so
+    a long queue is neither fetched nor stored as a whole.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: SynoAudioStationClient) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._client = client
+        self._queues: dict[str, _PlayerQueue] = {}
+        self._fetches: dict[tuple[str, int, int], asyncio.Task[list[dict[str, Any]]]] = {}
+
+    @callback
+    def _queue(self, player_id: str, version: int) -> _PlayerQueue:
+        """Return the cached queue of a player, dropping it when the queue changed."""
+        queue = self._queues.get(player_id)
+        if queue is None or queue.version != version:
+            queue = self._queues[player_id] = _PlayerQueue(version)
+        return queue
+
+    @callback
+    def get_cached(self, player_id: str, version: int, offset: int, limit: int) -> list[dict[str, Any]] | None:
+        """Return part of a queue if its pages are cached, without fetching anything."""
+        queue = self._queues.get(player_id)
+        if queue is None or queue.version != version:
+            return None
+        songs: list[dict[str, Any]] = []
+        for page in range(offset - offset % QUEUE_PAGE_SIZE, offset + limit, QUEUE_PAGE_SIZE):
+            if queue.total is not None and page >= queue.total:
+                break
+            if (cached := queue.pages.get(page)) is None:
+                return None
+            songs.extend(cached)
+        start = offset % QUEUE_PAGE_SIZE
+        return songs[start:start + limit]
+
+    async def async_get(self, player_id: str, version: int, offset: int, limit: int) -> dict[str, Any]:
+        """Return part of a queue and its length, fetching the pages that are not cached."""
+        queue = self._queue(player_id, version)
+        songs: list[dict[str, Any]] = []
+        for page in range(offset - offset % QUEUE_PAGE_SIZE, offset + limit, QUEUE_PAGE_SIZE):
+            if queue.total is not None and page >= queue.total:
+                break
+            songs.extend(await self._async_page(player_id, queue, page))
+        start = offset % QUEUE_PAGE_SIZE
+        return {"total": queue.total or 0, "offset": offset, "songs": songs[start:start + limit]}
+
+    async def _async_page(self, player_id: str, queue: _PlayerQueue, page: int) -> list[dict[str, Any]]:
+        """Return one page of a queue, concurrent callers share one fetch."""
+        if (cached := queue.pages.get(page)) is not None:
+            queue.pages.move_to_end(page)
+            return cached
+
+        key = (player_id, queue.version, page)
+        if (fetch := self._fetches.get(key)) is None:
+            fetch = self._fetches[key] = self._hass.async_create_task(self._async_fetch(player_id, queue, page))
+            fetch.add_done_callback(lambda _: self._fetches.pop(key, None))
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(self, player_id: str, queue: _PlayerQueue, page: int) -> list[dict[str, Any]]:
+        """Fetch a page from the NAS and keep it."""
+        data = await self._client.remote_player_get_playlist(player_id, page, QUEUE_PAGE_SIZE)
+        songs = [_queue_song(page + index, song) for index, song in enumerate(data.get("songs") or [])]
+        queue.total = data.get("total", 0)
+        queue.pages[page] = songs
+        while len(queue.pages) > QUEUE_MAX_PAGES:
+            queue.pages.popitem(last=False)
+        return songs
+
+    @callback
+    def async_forget(self, player_ids: set[str]) -> None:
+        """Drop the queues of players that vanished."""
+        for player_id in player_ids:
+            self._queues.pop(player_id, None)
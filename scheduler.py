@@ -0,0 +1,127 @@
+"""Order the requests sent to a NAS by how much a user is waiting for them."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+import heapq
+from itertools import count
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+class RequestPriority(IntEnum):
+    """Priority classes of requests, lower values are sent first."""
+
+    # A user pressed a button or called a service
+    INTERACTIVE = 0
+    # Reading a player back after a command
+    CONFIRMATION = 1
+    # Periodic status polls and player discovery
+    POLL = 2
+    # Library sync, can be interrupted and repeated at any time
+    BULK = 3
+
+
+# Requests without a priority are assumed to have someone waiting for them
+_priority: ContextVar[RequestPriority] = ContextVar("synology_dsaudio_priority", default=RequestPriority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Send the requests made inside the block, and the tasks it starts, at a priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+    """Limit the requests in flight to a NAS, handing free slots out by priority.
+
+    Bulk requests are only reads that can be repeated, so when a more urgent
+    request has to wait for a slot one of them is cancelled and queued again.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        """Initialize the scheduler."""
+        self.max_concurrent = max_concurrent
+        self._running = 0
+        # (priority, arrival, future) of the requests waiting for a slot
+        self._waiting: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._arrival = count()
+        self._bulk: set[asyncio.Task] = set()
+        self._preempted: set[asyncio.Task] = set()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(not future.done() for _, _, future in self._waiting)
+
+    async def async_run(self, send: Callable[[], Awaitable[_T]]) -> _T:
+        """Send a request at the priority of the caller once a slot is free."""
+        priority = _priority.get()
+        if priority < RequestPriority.BULK:
+            await self._async_acquire(priority)
+            try:
+                return await send()
+            finally:
+                self._release()
+
+        while True:
+            await self._async_acquire(priority)
+            task = asyncio.ensure_future(send())
+            self._bulk.add(task)
+            try:
+                await asyncio.wait([task])
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            finally:
+                self._bulk.discard(task)
+                self._release()
+            self._preempted.discard(task)
+            if not task.cancelled():
+                return task.result()
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Wait for a free slot."""
+        while self._waiting and self._waiting[0][2].done():
+            heapq.heappop(self._waiting)
+        if self._running < self.max_concurrent and not self._waiting:
+            self._running += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._arrival), future))
+        if priority < RequestPriority.BULK:
+            self._preempt()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand a slot to the most urgent waiting request."""
+        self._running -= 1
+        while self._waiting:
+            _, _, future = heapq.heappop(self._waiting)
+            if not future.done():
+                self._running += 1
+                future.set_result(None)
+                return
+
+    def _preempt(self) -> None:
+        """Cancel a bulk request in flight, it is sent again later."""
+        for task in self._bulk:
+            if task not in self._preempted and not task.done():
+                self._preempted.add(task)
+                task.cancel()
+                return
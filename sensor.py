@@ -0,0 +1,116 @@
+"""Diagnostic sensors of the requests sent to a Synology NAS and of its executor."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .api.SynoApi import SynoApi
+from .const import API_KEY_METRICS, DOMAIN, SYNO_API
+from .entity import SynologyDSMBaseEntity, SynologyDSMEntityDescription
+
+
+@dataclass
+class SynologyDSMSensorEntityDescription(
+    SensorEntityDescription, SynologyDSMEntityDescription
+):
+    """Describes Synology DSM metric sensor entity."""
+
+    # API method the sensor reports on, None for the total of all methods
+    method: str | None = None
+    # Metric of the method shown as the state
+    value: str = "p95_ms"
+
+
+def _latency_sensor(key: str, name: str, method: str) -> SynologyDSMSensorEntityDescription:
+    """Describe a sensor of the 95th percentile latency of an API method."""
+    return SynologyDSMSensorEntityDescription(
+        api_key=API_KEY_METRICS,
+        key=key,
+        name=name,
+        method=method,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+
+
+METRIC_SENSORS: tuple[SynologyDSMSensorEntityDescription, ...] = (
+    _latency_sensor("status_latency", "Status request latency", "SYNO.AudioStation.RemotePlayer.getstatus"),
+    _latency_sensor("control_latency", "Control request latency", "SYNO.AudioStation.RemotePlayer.control"),
+    _latency_sensor("login_latency", "Login latency", "SYNO.API.Auth.login"),
+    _latency_sensor("executor_queue_wait", "Executor queue wait", "executor.queue_wait"),
+    SynologyDSMSensorEntityDescription(
+        api_key=API_KEY_METRICS,
+        key="executor_utilisation",
+        name="Executor utilisation",
+        method="executor",
+        value="utilisation",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SynologyDSMSensorEntityDescription(
+        api_key=API_KEY_METRICS,
+        key="request_errors",
+        name="Request errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+async def async_setup_entry(
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Synology NAS metric sensors."""
+    api: SynoApi = hass.data[DOMAIN][entry.entry_id][SYNO_API]
+    async_add_entities(
+        SynologyDSMMetricSensor(api, description) for description in METRIC_SENSORS
+    )
+
+
+class SynologyDSMMetricSensor(SynologyDSMBaseEntity, SensorEntity):
+    """Latency (p95) or error count of the requests sent to the NAS."""
+
+    entity_description: SynologyDSMSensorEntityDescription
+
+    def __init__(self, api: SynoApi, description: SynologyDSMSensorEntityDescription) -> None:
+        """Initialize the sensor."""
+        super().__init__(api, api.metrics_coordinator, description)
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the 95th percentile latency of the method, or the number of failed requests."""
+        if self.entity_description.method is None:
+            # Executor jobs are published alongside, they are not requests to the NAS
+            return sum(
+                metrics.get("errors", 0)
+                for method, metrics in self.coordinator.data.items()
+                if not method.startswith("executor")
+            )
+        return self.coordinator.data.get(self.entity_description.method, {}).get(self.entity_description.value)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the call count, error count and other percentiles of the method."""
+        if self.entity_description.method is None:
+            return {}
+        return self.coordinator.data.get(self.entity_description.method, {})
@@ -1,19 +1,42 @@
+import asyncio
+from functools import partial
+from typing import Any
+
 import voluptuous as vol
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import ServiceCall, callback, HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     config_validation as cv,
     entity_registry as er,
 )
 from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import const
 from .api.SynoApi import SynoApi
+from .lanes import COMMAND_SHUFFLE, COMMAND_TRANSPORT
 from .shared import LOGGER
-from .synology_dsm.api.audio_station import SynoAudioStation, SongSortMode, RemotePlayerAction, Player
+from .synology_dsm.api.audio_station import RemotePlayerAction, RemotePlayerStatus, SongSortMode
 from .synology_dsm.api.audio_station.models.queue_mode import QueueMode
+from .synology_dsm.exceptions import SynologyDSMException
+
+QUEUE_MODES = [mode.value for mode in QueueMode]
+# Player actions replacing each other while waiting in the command lane, like those of the entity
+TRANSPORT_ACTIONS = (RemotePlayerAction.play, RemotePlayerAction.pause, RemotePlayerAction.stop)
+# Targets of one service call handled at the same time
+MAX_PARALLEL_TARGETS = 10
+
+PLAYER_IDS = vol.All(cv.ensure_list, vol.Length(min=1), [cv.entity_domain("media_player")])
 
 nasByIdSchema = vol.Schema(
     {
@@ -24,39 +47,51 @@ nasByIdSchema = vol.Schema(
 playerByUuidSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
+    }
+)
+
+playerQueueSchema = vol.Schema(
+    {
+        vol.Optional(const.CONF_SERIAL): str,
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
+        vol.Optional(const.SERVICE_INPUT_OFFSET): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(const.SERVICE_INPUT_LIMIT, default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
     }
 )
 
 playerUpdateSongsSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
         vol.Required(const.SERVICE_INPUT_SONGS): str,
+        vol.Optional(const.SERVICE_INPUT_QUEUE_MODE, default=QueueMode.replace.value): vol.In(QUEUE_MODES),
     }
 )
 
 playerArtistSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
         vol.Required(const.SERVICE_INPUT_ARTIST): str,
+        vol.Optional(const.SERVICE_INPUT_QUEUE_MODE, default=QueueMode.replace.value): vol.In(QUEUE_MODES),
     }
 )
 
 playerAlbumSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
         vol.Required(const.SERVICE_INPUT_ALBUM_NAME): str,
         vol.Required(const.SERVICE_INPUT_ALBUM_ARTIST): str,
+        vol.Optional(const.SERVICE_INPUT_QUEUE_MODE, default=QueueMode.replace.value): vol.In(QUEUE_MODES),
     }
 )
 
 playerVolumeSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
         vol.Required(const.SERVICE_INPUT_VOLUME): int,
     }
 )
@@ -64,7 +99,7 @@ playerVolumeSchema = vol.Schema(
 playerShuffleSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
         vol.Required(const.SERVICE_INPUT_SHUFFLE): bool,
     }
 )
@@ -72,16 +107,34 @@ playerShuffleSchema = vol.Schema(
 playerPlayerControlSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
-        vol.Required(const.SERVICE_INPUT_ACTION): str,
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
+        vol.Required(const.SERVICE_INPUT_ACTION): vol.In([action.value for action in RemotePlayerAction]),
     }
 )
 
 playerJumpToSongSchema = vol.Schema(
     {
         vol.Optional(const.CONF_SERIAL): str,
-        vol.Required(const.SERVICE_INPUT_PLAYER_ID): cv.entity_domain("media_player"),
-        vol.Required(const.SERVICE_INPUT_POSITION): str,
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
+        vol.Required(const.SERVICE_INPUT_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+searchLibrarySchema = vol.Schema(
+    {
+        vol.Optional(const.CONF_SERIAL): str,
+        vol.Required(const.SERVICE_INPUT_QUERY): str,
+        vol.Optional(const.SERVICE_INPUT_LIMIT, default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+playSearchSchema = vol.Schema(
+    {
+        vol.Optional(const.CONF_SERIAL): str,
+        vol.Required(const.SERVICE_INPUT_PLAYER_ID): PLAYER_IDS,
+        vol.Required(const.SERVICE_INPUT_QUERY): str,
+        vol.Optional(const.SERVICE_INPUT_LIMIT, default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+        vol.Optional(const.SERVICE_INPUT_QUEUE_MODE, default=QueueMode.replace.value): vol.In(QUEUE_MODES),
     }
 )
 
@@ -94,7 +147,7 @@ SERVICE_RECONNECT_CLIENT_SCHEMA = vol.All(
 
 SUPPORTED_SERVICES = (
     const.SERVICE_FUNC_GETPLAYER_STATUS,
-    const.SERVICE_FUNC_GETPLAYERS,
+    const.SERVICE_FUNC_GET_PLAYER_QUEUE,
     const.SERVICE_FUNC_REMOTE_PLAY_SONGS,
     const.SERVICE_FUNC_REMOTE_PLAY_ARTIST,
     const.SERVICE_FUNC_REMOTE_PLAY_ALBUM,
@@ -107,7 +160,7 @@ SUPPORTED_SERVICES = (
 
 SERVICE_TO_SCHEMA = {
     const.SERVICE_FUNC_GETPLAYER_STATUS: playerByUuidSchema,
-    const.SERVICE_FUNC_GETPLAYERS: nasByIdSchema,
+    const.SERVICE_FUNC_GET_PLAYER_QUEUE: playerQueueSchema,
     const.SERVICE_FUNC_REMOTE_PLAY_SONGS: playerUpdateSongsSchema,
     const.SERVICE_FUNC_REMOTE_PLAY_ARTIST: playerArtistSchema,
     const.SERVICE_FUNC_REMOTE_PLAY_ALBUM: playerAlbumSchema,
@@ -118,6 +171,16 @@ SERVICE_TO_SCHEMA = {
     const.SERVICE_FUNC_REMOTE_PLAYER_CLEAR_PLAYLIST: playerByUuidSchema,
 }
 
+# Player services only useful for the data they answer with
+RESPONSE_ONLY_SERVICES = (const.SERVICE_FUNC_GETPLAYER_STATUS, const.SERVICE_FUNC_GET_PLAYER_QUEUE)
+
+# Services answering with data, served from what the integration already knows
+SEARCH_SERVICES = {
+    const.SERVICE_FUNC_GETPLAYERS: (nasByIdSchema, SupportsResponse.ONLY),
+    const.SERVICE_FUNC_SEARCH_LIBRARY: (searchLibrarySchema, SupportsResponse.ONLY),
+    const.SERVICE_FUNC_PLAY_SEARCH: (playSearchSchema, SupportsResponse.OPTIONAL),
+}
+
 
 def get_entity_config(
         hass: HomeAssistant, config_entry_id: str
@@ -130,12 +193,17 @@ def get_entity_config(
 
 
 @callback
-def _get_dsm_instance_for_entity(hass: HomeAssistant, entity_entry: RegistryEntry) -> SynoApi:
-    if not (dsm := get_entity_config(hass, entity_entry.config_entry_id)):
-        raise HomeAssistantError(
-            f"No config found for entity: {entity_entry.id}, config {entity_entry.config_entry_id}")
+def _get_dsm_instance_by_serial(hass: HomeAssistant, serial: str | None) -> SynoApi:
+    apis = [data[const.SYNO_API] for data in hass.data.get(const.DOMAIN, {}).values()]
+    if serial is None:
+        if len(apis) != 1:
+            raise HomeAssistantError("More than one NAS configured, a serial is required")
+        return apis[0]
 
-    return dsm
+    for api in apis:
+        if api.information and api.information.serial == serial:
+            return api
+    raise HomeAssistantError(f"No NAS found with serial: {serial}")
 
 
 @callback
@@ -147,16 +215,57 @@ def _get_entity_by_player_id(hass: HomeAssistant, entity_id: str) -> RegistryEnt
     return entity_entry
 
 
+class PlayerIndex:
+    """Map media player entities to the NAS and the Audio Station player behind them.
+
+    Filled on first use and invalidated by entity registry changes, so service
+    calls do not look up the registry for every target.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty index."""
+        self._hass = hass
+        # entity id: (config entry id, player id)
+        self._players: dict[str, tuple[str, str]] = {}
+
+    @callback
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Follow the entity registry."""
+        return self._hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated)
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Forget an entity that was removed, renamed or moved to another entry."""
+        self._players.pop(event.data["entity_id"], None)
+        if old_entity_id := event.data.get("old_entity_id"):
+            self._players.pop(old_entity_id, None)
+
+    @callback
+    def async_resolve(self, entity_id: str) -> tuple[SynoApi, str]:
+        """Return the NAS and the player id of a media player entity."""
+        if (player := self._players.get(entity_id)) is None:
+            entity = _get_entity_by_player_id(self._hass, entity_id)
+            player = self._players[entity_id] = (entity.config_entry_id, entity.unique_id)
+
+        config_entry_id, player_id = player
+        if not (syno_api := get_entity_config(self._hass, config_entry_id)):
+            raise HomeAssistantError(f"No config found for entity: {entity_id}, config {config_entry_id}")
+        return syno_api, player_id
+
+
 @callback
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for integration."""
+    # Shared by all config entries, registered with the first one
+    if hass.services.has_service(const.DOMAIN, const.SERVICE_FUNC_GETPLAYER_STATUS):
+        return
 
-    dsm_services = {
-        const.SERVICE_FUNC_GETPLAYERS: get_players,
-    }
+    player_index = PlayerIndex(hass)
+    player_index.async_listen()
 
     media_player_services = {
         const.SERVICE_FUNC_GETPLAYER_STATUS: get_player_status,
+        const.SERVICE_FUNC_GET_PLAYER_QUEUE: get_player_queue,
         const.SERVICE_FUNC_REMOTE_PLAY_SONGS: remote_update_play_songs,
         const.SERVICE_FUNC_REMOTE_PLAY_ARTIST: remote_update_play_artist,
         const.SERVICE_FUNC_REMOTE_PLAY_ALBUM: remote_update_play_album,
@@ -167,23 +276,82 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         const.SERVICE_FUNC_REMOTE_PLAYER_CLEAR_PLAYLIST: remote_player_clear_playlist,
     }
 
-    async def async_call_syno_service(service_call: ServiceCall) -> None:
-        """Call correct DSM service."""
-
-        # call with a media player
-        ha_player_id = service_call.data.get(const.SERVICE_INPUT_PLAYER_ID)
-
-        entity = _get_entity_by_player_id(hass, ha_player_id)
-        syno_api = _get_dsm_instance_for_entity(hass, entity)
-
-        audio_station = syno_api.dsm.audio_station
-
-        dsm_player_id = entity.unique_id
+    async def async_call_syno_service(service_call: ServiceCall) -> ServiceResponse:
+        """Call correct DSM service on every targeted player at once."""
+        targets = service_call.data[const.SERVICE_INPUT_PLAYER_ID]
+        if not targets:
+            raise HomeAssistantError("No media player given")
+        service = media_player_services[service_call.service]
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TARGETS)
+
+        async def async_call_player(ha_player_id: str) -> Any:
+            # An unknown entity only fails its own call
+            syno_api, player_id = player_index.async_resolve(ha_player_id)
+            async with semaphore:
+                return await service(syno_api, player_id, service_call.data)
+
+        results = await asyncio.gather(
+            *(async_call_player(ha_player_id) for ha_player_id in targets), return_exceptions=True
+        )
 
-        res = await hass.async_add_executor_job(
-            media_player_services[service_call.service], audio_station, dsm_player_id, service_call.data)
+        response: dict[str, Any] = {}
+        errors = []
+        for ha_player_id, result in zip(targets, results):
+            if isinstance(result, (HomeAssistantError, SynologyDSMException)):
+                LOGGER.warning("%s failed on %s: %s", service_call.service, ha_player_id, result)
+                errors.append(result)
+                response[ha_player_id] = {"success": False, "error": str(result)}
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                LOGGER.debug("%s on %s: %s", service_call.service, ha_player_id, result)
+                response[ha_player_id] = {"success": True, **result} if isinstance(result, dict) else {"success": True}
+
+        if len(errors) == len(targets):
+            raise HomeAssistantError(f"{service_call.service} failed: {errors[0]}") from errors[0]
+        return {"players": response} if service_call.return_response else None
+
+    async def async_search_library(service_call: ServiceCall) -> ServiceResponse:
+        """Find songs in the library index of a NAS."""
+        syno_api = _get_dsm_instance_by_serial(hass, service_call.data.get(const.CONF_SERIAL))
+        return {"songs": await search_library(syno_api, service_call.data)}
+
+    async def async_get_players(service_call: ServiceCall) -> ServiceResponse:
+        """List the players of a NAS."""
+        syno_api = _get_dsm_instance_by_serial(hass, service_call.data.get(const.CONF_SERIAL))
+        return {"players": get_players(syno_api)}
+
+    async def async_play_search(service_call: ServiceCall) -> ServiceResponse:
+        """Replace the queue of players with the songs best matching a query."""
+        targets = [
+            player_index.async_resolve(ha_player_id)
+            for ha_player_id in service_call.data[const.SERVICE_INPUT_PLAYER_ID]
+        ]
+        if not targets:
+            raise HomeAssistantError("No media player given")
+
+        # One search per NAS, the players of a NAS share its library
+        songs_by_nas: dict[SynoApi, list[dict]] = {}
+        for syno_api, _ in targets:
+            if syno_api not in songs_by_nas:
+                songs_by_nas[syno_api] = await search_library(syno_api, service_call.data)
+
+        mode = QueueMode(service_call.data[const.SERVICE_INPUT_QUEUE_MODE])
+        await asyncio.gather(
+            *(
+                syno_api.async_queue_songs(
+                    player_id, [song["id"] for song in songs_by_nas[syno_api]], mode, mode == QueueMode.replace
+                )
+                for syno_api, player_id in targets
+            )
+        )
+        return {"songs": songs_by_nas[targets[0][0]]}
 
-        LOGGER.info(res)
+    search_services = {
+        const.SERVICE_FUNC_GETPLAYERS: async_get_players,
+        const.SERVICE_FUNC_SEARCH_LIBRARY: async_search_library,
+        const.SERVICE_FUNC_PLAY_SEARCH: async_play_search,
+    }
 
     for service in SUPPORTED_SERVICES:
         hass.services.async_register(
@@ -191,74 +359,144 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             service,
             async_call_syno_service,
             schema=SERVICE_TO_SCHEMA[service],
+            supports_response=(
+                SupportsResponse.ONLY if service in RESPONSE_ONLY_SERVICES else SupportsResponse.OPTIONAL
+            ),
+        )
+
+    for service, (schema, supports_response) in SEARCH_SERVICES.items():
+        hass.services.async_register(
+            const.DOMAIN,
+            service,
+            search_services[service],
+            schema=schema,
+            supports_response=supports_response,
         )
 
 
 @callback
 def async_unload_services(hass) -> None:
     """Unload UniFi Network services."""
-    for service in SUPPORTED_SERVICES:
+    for service in (*SUPPORTED_SERVICES, *SEARCH_SERVICES):
         hass.services.async_remove(const.DOMAIN, service)
 
 
-async def get_players(audio_station: SynoAudioStation, data: ReadOnlyDict) -> list[Player]:
-    return audio_station.remote_player_get_players()
+async def search_library(syno_api: SynoApi, data: ReadOnlyDict) -> list[dict]:
+    query = data[const.SERVICE_INPUT_QUERY]
+    songs = await syno_api.library.async_search(query, data[const.SERVICE_INPUT_LIMIT])
+    if not songs and not syno_api.library.ready:
+        raise HomeAssistantError("The library is still being indexed, try again later")
+    if not songs:
+        raise HomeAssistantError(f"No songs found for: {query}")
+    return songs
+
+
+@callback
+def get_players(syno_api: SynoApi) -> list[dict]:
+    # Kept current by the player discovery, no need to ask the NAS
+    return [player.to_dict() for player in syno_api.players]
+
+
+async def _async_get_status(syno_api: SynoApi, player_id: str) -> RemotePlayerStatus:
+    try:
+        status = await syno_api.remote_player_coordinator.async_get_status(player_id)
+    except UpdateFailed as err:
+        raise HomeAssistantError(str(err)) from err
+    if status is None:
+        raise HomeAssistantError(f"Player {player_id} did not report a status")
+    return status
+
+
+async def get_player_status(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> dict:
+    status = await _async_get_status(syno_api, player_id)
+    return {"status": status.to_dict()}
 
 
-def get_player_status(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> None:
-    return audio_station.remote_player_get_player_status(player_id)
+async def get_player_queue(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> dict:
+    status = await _async_get_status(syno_api, player_id)
+    # From the current song on by default
+    offset = data.get(const.SERVICE_INPUT_OFFSET, status.index)
+    queue = await syno_api.queue_cache.async_get(
+        player_id, status.playlist_timestamp, offset, data[const.SERVICE_INPUT_LIMIT]
+    )
+    return {"queue": {**queue, "current": status.index}}
 
 
-def remote_update_play_songs(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
-    songs = data.get(const.SERVICE_INPUT_SONGS)
-    mode = QueueMode.replace
-    play_directly = True
+async def remote_update_play_songs(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
+    songs = [song.strip() for song in data.get(const.SERVICE_INPUT_SONGS).split(",") if song.strip()]
+    mode = QueueMode(data.get(const.SERVICE_INPUT_QUEUE_MODE))
+    # Appending keeps the current song playing
+    play_directly = mode == QueueMode.replace
 
-    return audio_station.remote_player_play_songs(player_id, songs, mode, play_directly)
+    # Not in the command lane, appending can wait for a long earlier load to finish
+    return await syno_api.async_queue_songs(player_id, songs, mode, play_directly)
 
 
-def remote_update_play_artist(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
+async def remote_update_play_artist(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
     artist = data.get(const.SERVICE_INPUT_ARTIST)
-    mode = QueueMode.replace
-    play_directly = True
+    mode = QueueMode(data.get(const.SERVICE_INPUT_QUEUE_MODE))
+    play_directly = mode == QueueMode.replace
 
-    return audio_station.remote_player_play_artist(player_id, artist, SongSortMode.album, mode, play_directly)
+    return await syno_api.async_player_command(
+        player_id,
+        None,
+        partial(
+            syno_api.audio_station.remote_player_play_artist, player_id, artist, SongSortMode.album, mode, play_directly
+        ),
+    )
 
 
-def remote_update_play_album(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
+async def remote_update_play_album(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
     album_artist = data.get(const.SERVICE_INPUT_ALBUM_ARTIST)
     album_name = data.get(const.SERVICE_INPUT_ALBUM_NAME)
 
-    mode = QueueMode.replace
-    play_directly = True
+    mode = QueueMode(data.get(const.SERVICE_INPUT_QUEUE_MODE))
+    play_directly = mode == QueueMode.replace
 
-    return audio_station.remote_player_play_album(player_id, album_name,
-                                                  album_artist, SongSortMode.track, mode, play_directly)
+    return await syno_api.async_player_command(
+        player_id,
+        None,
+        partial(
+            syno_api.audio_station.remote_player_play_album,
+            player_id, album_name, album_artist, SongSortMode.track, mode, play_directly,
+        ),
+    )
 
 
-def remote_player_shuffle(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
+async def remote_player_shuffle(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
     shuffle_mode = data.get(const.SERVICE_INPUT_SHUFFLE)
 
-    return audio_station.remote_player_shuffle(player_id, shuffle_mode)
+    return await syno_api.async_player_command(
+        player_id, COMMAND_SHUFFLE, partial(syno_api.audio_station.remote_player_shuffle, player_id, shuffle_mode)
+    )
 
 
-def remote_player_control(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
+async def remote_player_control(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
     action = RemotePlayerAction(data.get(const.SERVICE_INPUT_ACTION))
 
-    return audio_station.remote_player_control(player_id, action)
+    return await syno_api.async_player_command(
+        player_id,
+        COMMAND_TRANSPORT if action in TRANSPORT_ACTIONS else None,
+        partial(syno_api.audio_station.remote_player_control, player_id, action),
+    )
 
 
-def remote_player_jump_to_song(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
-    position = int(data.get(const.SERVICE_INPUT_POSITION))
+async def remote_player_jump_to_song(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
+    position = data.get(const.SERVICE_INPUT_POSITION)
 
-    return audio_station.remote_player_jump_to_song(player_id, position)
+    return await syno_api.async_player_command(
+        player_id, None, partial(syno_api.audio_station.remote_player_jump_to_song, player_id, position)
+    )
 
 
-def remote_player_volume(audio_station: SynoAudioStation, player_id: str, data: ReadOnlyDict) -> bool:
+async def remote_player_volume(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
     volume = data.get(const.SERVICE_INPUT_VOLUME)
-    return audio_station.remote_player_volume(player_id, volume)
+    # Replaces a slider value of the entity still waiting to be sent
+    await syno_api.volume_lane(player_id).async_send(volume)
+    return True
 
 
-def remote_player_clear_playlist(audio_station: SynoAudioStation, player_id: str,
-                                 data: ReadOnlyDict) -> bool:
-    return audio_station.remote_player_clear_playlist(player_id)
+async def remote_player_clear_playlist(syno_api: SynoApi, player_id: str, data: ReadOnlyDict) -> bool:
+    return await syno_api.async_player_command(
+        player_id, None, partial(syno_api.audio_station.remote_player_clear_playlist, player_id)
+    )
@@ -0,0 +1,173 @@
+"""Keep the connection to a NAS alive without reloading the config entry."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import random
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .shared import LOGGER
+from .synology_dsm.exceptions import (
+    SynologyDSMLogin2SARequiredException,
+    SynologyDSMLoginDisabledAccountException,
+    SynologyDSMLoginFailedException,
+    SynologyDSMLoginInvalidException,
+    SynologyDSMLoginPermissionDeniedException,
+    SynologyDSMRequestException,
+)
+
+# Retrying cannot fix these, the user has to update the credentials
+AUTH_ERRORS = (
+    SynologyDSMLogin2SARequiredException,
+    SynologyDSMLoginDisabledAccountException,
+    SynologyDSMLoginInvalidException,
+    SynologyDSMLoginPermissionDeniedException,
+)
+CONNECTION_ERRORS = (SynologyDSMLoginFailedException, SynologyDSMRequestException)
+
+RECONNECT_MIN_DELAY = 5  # sec
+RECONNECT_MAX_DELAY = 300  # sec
+# Consecutive failed polls before the NAS is considered down
+FAILURE_THRESHOLD = 3
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return the wait before a retry, doubling per attempt with jitter.
+
+    Half of the delay is random, so integrations reconnecting to the same NAS
+    after a network outage do not all knock at the same moment.
+    """
+    delay = min(RECONNECT_MAX_DELAY, RECONNECT_MIN_DELAY * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class ConnectionSupervisor:
+    """Circuit breaker around the connection to a NAS.
+
+    Closed while requests succeed. After FAILURE_THRESHOLD consecutive
+    failures it opens: the NAS is reported unavailable, polling stops and a
+    background task logs in again with exponential backoff until it succeeds.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            on_availability_changed: Callable[[], None],
+    ) -> None:
+        """Initialize the supervisor."""
+        self._hass = hass
+        self._entry = entry
+        self._on_availability_changed = on_availability_changed
+
+        self.available = True
+        self._failures = 0
+        self._task: asyncio.Task[None] | None = None
+        entry.async_on_unload(self.async_stop)
+
+    @property
+    def connecting(self) -> bool:
+        """Return True while a (re)connection is in progress."""
+        return self._task is not None
+
+    @callback
+    def async_report_success(self) -> None:
+        """Record a successful request."""
+        self._failures = 0
+
+    @callback
+    def async_report_failure(
+            self,
+            err: Exception,
+            reconnect: Callable[[], Awaitable[None]],
+            on_reconnected: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Record a failed request, opening the circuit when the NAS looks down."""
+        if self._task is not None:
+            return
+        self._failures += 1
+        if self._failures < FAILURE_THRESHOLD:
+            LOGGER.debug("Request to '%s' failed (%s in a row): %s", self._entry.unique_id, self._failures, err)
+            return
+
+        LOGGER.warning("Lost connection to '%s', reconnecting: %s", self._entry.unique_id, err)
+        self._set_available(False)
+        self._async_start(reconnect, on_reconnected)
+
+    @callback
+    def async_connect(
+            self,
+            connect: Callable[[], Awaitable[None]],
+            on_connected: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        """Connect in the background, retrying with backoff, without closing the circuit."""
+        if self._task is None:
+            self._async_start(connect, on_connected)
+
+    @callback
+    def _async_start(
+            self,
+            connect: Callable[[], Awaitable[None]],
+            on_connected: Callable[[], Awaitable[None]] | None,
+    ) -> None:
+        """Start the connection task."""
+        self._task = self._hass.async_create_background_task(
+            self._async_run(connect, on_connected), f"Connect to {self._entry.title}"
+        )
+
+    async def _async_run(
+            self,
+            connect: Callable[[], Awaitable[None]],
+            on_connected: Callable[[], Awaitable[None]] | None,
+    ) -> None:
+        """Try to connect until it works or the credentials are rejected.
+
+        Any other error is retried with backoff.
+        """
+        attempt = 0
+        try:
+            while True:
+                try:
+                    await connect()
+                    break
+                except AUTH_ERRORS as err:
+                    LOGGER.error("Unable to log in to '%s': %s", self._entry.unique_id, err)
+                    # Whatever the entities show is outdated until the user logs in again
+                    self._set_available(False)
+                    self._entry.async_start_reauth(self._hass)
+                    return
+                except CONNECTION_ERRORS as err:
+                    LOGGER.debug("Unable to connect to '%s': %s", self._entry.unique_id, err)
+                except Exception:  # pylint: disable=broad-except
+                    # An API error or a bug must not end the task, the entry would never connect
+                    LOGGER.exception("Unexpected error connecting to '%s'", self._entry.unique_id)
+
+                delay = backoff_delay(attempt)
+                attempt += 1
+                LOGGER.debug("Retrying to connect to '%s' in %.0f seconds", self._entry.unique_id, delay)
+                await asyncio.sleep(delay)
+        finally:
+            self._task = None
+
+        if not self.available:
+            LOGGER.info("Reconnected to '%s'", self._entry.unique_id)
+        self._failures = 0
+        self._set_available(True)
+        if on_connected is not None:
+            await on_connected()
+
+    @callback
+    def _set_available(self, available: bool) -> None:
+        """Change the availability of the NAS and let the entities know."""
+        if self.available != available:
+            self.available = available
+            self._on_availability_changed()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop connecting."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None